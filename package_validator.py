@@ -7,42 +7,933 @@ Validates structure, JSON syntax, keys, values, and cross-references
 based on the package uploader validation logic.
 """
 
+import concurrent.futures
+import functools
 import json
+import queue
+import threading
 import zipfile
 import os
 import sys
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, Iterator, List, Any, Tuple, Optional
 import argparse
 import re
+from dataclasses import dataclass
+
+try:
+    import orjson as _json  # 3-5x faster C parser; takes bytes directly
+except ImportError:
+    _json = json
+
+try:
+    import fastjsonschema as _fastjsonschema  # compiled structural validation
+except ImportError:
+    _fastjsonschema = None
+
+# Below this many JSON members, process-pool startup costs more than it saves.
+_PARALLEL_JSON_THRESHOLD = 16
+
+# Minimum stimulus-file count before per-file validation uses a process pool.
+_PARALLEL_VALIDATE_THRESHOLD = 4
+
+# Precompiled patterns for the per-stim hot path.
+# Codepoints U+0080-U+00FF are stripped downstream; detect them with a
+# delete-translation table, which scans at C speed without the regex engine.
+_HIBYTE_TABLE = dict.fromkeys(range(0x80, 0x100))
+
+
+def _has_hibyte(text: str) -> bool:
+    return len(text.translate(_HIBYTE_TABLE)) != len(text)
+
+
+def _never_hibyte(text: str) -> bool:
+    """Stand-in scan for files whose raw bytes were pure ASCII."""
+    return False
+_PARAM_RE = re.compile(r'^\d+(\.\d+)?,\d+(\.\d+)?$')
+
+# Display fields that may reference packaged media, and URL-ish prefixes that
+# mark a source as external rather than a member of the package.
+_MEDIA_FIELDS = frozenset(('audioSrc', 'imgSrc', 'videoSrc'))
+_VALID_RESPONSE_TYPES = frozenset(('text', 'audio', 'image', 'video', 'cloze'))
+_VALID_RESPONSE_TYPES_MSG = 'text, audio, image, video, cloze'
+_VALID_BEHAVIORS = frozenset(('none', 'all', 'some', 'adaptive'))
+_OPTIONAL_STR_FIELDS = ('speechHintExclusionList',)
+_OPTIONAL_ARR_FIELDS = ('alternateDisplays', 'tags')
+_DISPLAY_FIELDS = frozenset((
+    'text', 'audioSrc', 'imgSrc', 'videoSrc', 'clozeText', 'clozeStimulus',
+    'textStimulus', 'audioStimulus', 'imageStimulus', 'videoStimulus'))
+_URL_PREFIXES = ('http://', 'https://', 'data:', '//')
+
+# Comma-separated numbers/ranges (e.g. '1,2,3-5,7'); blank segments allowed.
+_CLUSTERLIST_RE = re.compile(
+    r'^\s*(?:\d+(?:\s*-\s*\d+)?)?\s*(?:,\s*(?:\d+(?:\s*-\s*\d+)?)?\s*)*$')
+_RANGE_RE = re.compile(r'(\d+)\s*-\s*(\d+)')
+_SPAN_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+_QUESTION_RE = re.compile(r'\?|choose|select|which|what is', re.IGNORECASE)
+_ADAPTIVE_REF_RE = re.compile(r'C(\d+)S(\d+)')
+
+# Report banner lines, built once instead of re-multiplied per unit
+_BANNER = "=" * 80
+_SUBBAR = "-" * 76
+
+# Detail keys the timeline report renders specially before the
+# generic key/value dump
+_SKIP_DETAIL_KEYS = frozenset((
+    'logic_rules', 'choice_ids', 'choice_texts', 'choice_correct_flags',
+    'question_text', 'correct_answer', 'incorrect_answers', 'warnings',
+))
+
+# Well-formed adaptive rule: validates the IF prefix and the presence of a
+# THEN clause in a single C-level scan instead of three substring checks.
+_ADAPTIVE_RULE_RE = re.compile(r'IF\s+.+?\s+THEN\s+.+')
+_CLUSTERLIST_TOKEN_RE = re.compile(r'(\d+)(?:-(\d+))?')
+
+
+@dataclass(slots=True)
+class FileMeta:
+    """Metadata for one zip member; slotted to stay light on huge packages."""
+    name: str
+    path: str
+    extension: str
+    content: Any
+    type: str
+    ascii_only: bool = False
+
+
+@dataclass(slots=True)
+class TimelineEvent:
+    """One step in a unit's execution timeline.
+
+    Large learning/assessment sessions materialize thousands of events,
+    so these are slotted instead of per-event dicts. to_dict() restores
+    the dict shape for callers that need JSON-compatible output.
+    """
+    type: str
+    description: str
+    details: Dict
+    time_seconds: Optional[int] = None
+
+    def to_dict(self) -> Dict:
+        event = {'type': self.type, 'description': self.description, 'details': self.details}
+        if self.time_seconds is not None:
+            event['time_seconds'] = self.time_seconds
+        return event
+
+
+def _parse_json_member(raw: Any) -> Tuple[Optional[Any], Optional[str], bool]:
+    """Decode one JSON zip member. Returns (content, error, ascii_only).
+
+    ascii_only is a one-pass C-level prescan of the raw bytes: a pure-ASCII
+    file with no \\u00XX escapes cannot decode to the high-byte characters
+    the stim checks scan for, so downstream validation skips those scans.
+    """
+    try:
+        if type(raw) is memoryview:
+            raw = raw.tobytes()  # bytes needed for the prescan (and stdlib json)
+        ascii_only = raw.isascii() and b'\\u00' not in raw
+        return _json.loads(raw), None, ascii_only
+    except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError
+        return None, str(e), True
+
+
+# JSON Schemas mirroring the structural (error-level) checks below; compiled
+# once with fastjsonschema when it is installed so per-field validation runs
+# as generated straight-line code instead of the interpreted cascade.
+_STIM_SCHEMA = {
+    'type': 'object',
+    'required': ['setspec'],
+    'properties': {
+        'setspec': {
+            'type': 'object',
+            'required': ['clusters'],
+            'properties': {
+                'clusters': {
+                    'type': 'array',
+                    'minItems': 1,
+                    'items': {
+                        'type': 'object',
+                        'required': ['stims'],
+                        'properties': {
+                            'stims': {
+                                'type': 'array',
+                                'minItems': 1,
+                                'items': {
+                                    'type': 'object',
+                                    'required': ['response'],
+                                    'properties': {
+                                        'response': {
+                                            'type': 'object',
+                                            'required': ['correctResponse'],
+                                            'properties': {
+                                                'incorrectResponses': {
+                                                    'anyOf': [
+                                                        {'type': 'string'},
+                                                        {'type': 'array',
+                                                         'items': {'type': 'string'}},
+                                                    ],
+                                                },
+                                            },
+                                        },
+                                        'display': {
+                                            'type': 'object',
+                                            'properties': {
+                                                field: {'type': 'string'}
+                                                for field in (
+                                                    'text', 'audioSrc', 'imgSrc', 'videoSrc',
+                                                    'clozeText', 'clozeStimulus', 'textStimulus',
+                                                    'audioStimulus', 'imageStimulus', 'videoStimulus')
+                                            },
+                                        },
+                                        'parameter': {'type': 'string'},
+                                        'optimalProb': {'type': 'number'},
+                                        'speechHintExclusionList': {'type': 'string'},
+                                        'alternateDisplays': {'type': 'array'},
+                                        'tags': {'type': 'array'},
+                                    },
+                                },
+                            },
+                            'responseType': {'type': 'string'},
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+_TDF_SCHEMA = {
+    'type': 'object',
+    'required': ['tutor'],
+    'properties': {
+        'tutor': {
+            'type': 'object',
+            'required': ['setspec'],
+            'properties': {
+                'setspec': {
+                    'type': 'object',
+                    'required': ['lessonname', 'stimulusfile'],
+                    'properties': {
+                        'lessonname': {'type': 'string', 'pattern': r'\S'},
+                        'stimulusfile': {'type': 'string'},
+                        'experimentTarget': {'type': 'string'},
+                    },
+                },
+                'unit': {'$ref': '#/$defs/units'},
+                'unitTemplate': {'$ref': '#/$defs/units'},
+            },
+        },
+    },
+    '$defs': {
+        'units': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'properties': {
+                    'clusterIndex': {'type': ['integer', 'string']},
+                    'assessmentsession': {
+                        'type': 'object',
+                        'properties': {'clusterlist': {'type': 'string'}},
+                    },
+                },
+            },
+        },
+    },
+}
+
+if _fastjsonschema is not None:
+    _stim_schema_check = _fastjsonschema.compile(_STIM_SCHEMA)
+    _tdf_schema_check = _fastjsonschema.compile(_TDF_SCHEMA)
+else:
+    _stim_schema_check = None
+    _tdf_schema_check = None
+
+
+def _scan_stimulus_warnings(content: Dict, file_name: str,
+                            errors: List[str], warnings: List[str],
+                            ascii_only: bool = False,
+                            fail_fast: bool = False) -> bool:
+    """Run the checks the schema cannot express: duplicate correctResponse
+    values plus the advisory warnings. Assumes the schema already passed.
+
+    A duplicate marks the file invalid but the scan keeps going (one
+    error per cluster, like the fallback path) unless fail_fast is set.
+    """
+    add_error = errors.append
+    add_warning = warnings.append
+    has_hibyte = _never_hibyte if ascii_only else _has_hibyte
+    hibyte_hits: List[str] = []
+    valid = True
+    for cluster_idx, cluster in enumerate(content['setspec']['clusters']):
+        seen_responses = set()
+        stims = cluster['stims']
+        for stim in stims:
+            if 'response' in stim and 'correctResponse' in stim['response']:
+                correct_response = stim['response']['correctResponse']
+                if correct_response in seen_responses:
+                    add_error(f"Duplicate correctResponse values in cluster {cluster_idx} of '{file_name}'")
+                    valid = False
+                    break
+                seen_responses.add(correct_response)
+        if not valid and fail_fast:
+            break
+
+        for stim_idx, stim in enumerate(stims):
+            response = stim['response']
+            correct_response = response['correctResponse']
+            if correct_response.__class__ is not str:
+                correct_response = str(correct_response)
+            if has_hibyte(correct_response):
+                hibyte_hits.append(f"stim {stim_idx} in cluster {cluster_idx} correctResponse")
+
+            if 'incorrectResponses' in response:
+                incorrect_responses = response['incorrectResponses']
+                if type(incorrect_responses) is str:
+                    if has_hibyte(incorrect_responses):
+                        hibyte_hits.append(f"stim {stim_idx} in cluster {cluster_idx} incorrectResponses")
+                else:
+                    for i, ir in enumerate(incorrect_responses):
+                        if has_hibyte(ir):
+                            hibyte_hits.append(f"stim {stim_idx} in cluster {cluster_idx} incorrectResponses[{i}]")
+            else:
+                display_text = ""
+                if 'display' in stim and 'text' in stim['display']:
+                    display_text = stim['display']['text']
+                if display_text and _QUESTION_RE.search(display_text):
+                    add_warning(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' appears to be a question but missing incorrectResponses")
+
+            if 'parameter' in stim and not _PARAM_RE.match(stim['parameter']):
+                add_warning(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' parameter '{stim['parameter']}' does not match expected format 'number,number'")
+
+        if 'responseType' in cluster:
+            response_type = cluster['responseType']
+            if response_type not in _VALID_RESPONSE_TYPES:
+                add_warning(f"Cluster {cluster_idx} in '{file_name}' responseType '{response_type}' is not a standard type (expected: {_VALID_RESPONSE_TYPES_MSG})")
+
+    if hibyte_hits:
+        warnings.append(
+            f"'{file_name}' has {len(hibyte_hits)} response field(s) with invisible "
+            f"unicode characters that will be removed (first: {hibyte_hits[0]})")
+
+    return valid
+
+
+def _check_stimulus_file(content: Dict, file_name: str,
+                         ascii_only: bool = False,
+                         fail_fast: bool = False) -> Tuple[bool, List[str], List[str]]:
+    """Validate a single stimulus file.
+
+    Pure function (no shared state) so it can run in a worker process;
+    returns (valid, errors, warnings) for the caller to merge.
+    """
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    if _stim_schema_check is not None:
+        try:
+            _stim_schema_check(content)
+        except _fastjsonschema.JsonSchemaException as e:
+            errors.append(f"Stimulus file '{file_name}' failed schema validation: {e.message}")
+            return False, errors, warnings
+        valid = _scan_stimulus_warnings(content, file_name, errors, warnings, ascii_only,
+                                        fail_fast)
+        return valid, errors, warnings
+
+    # Check setspec exists
+    if 'setspec' not in content:
+        errors.append(f"Stimulus file '{file_name}' missing 'setspec' key")
+        return False, errors, warnings
+
+    setspec = content['setspec']
+
+    # Check clusters array
+    if 'clusters' not in setspec:
+        errors.append(f"Stimulus file '{file_name}' missing 'clusters' in setspec")
+        return False, errors, warnings
+
+    clusters = setspec['clusters']
+    if not type(clusters) is list:
+        errors.append(f"Stimulus file '{file_name}' clusters is not an array")
+        return False, errors, warnings
+
+    if not clusters:
+        errors.append(f"Stimulus file '{file_name}' has no clusters")
+        return False, errors, warnings
+
+    # Validate each cluster, pooling per-field unicode hits into one warning
+    hibyte_hits: List[str] = []
+    valid = True
+    has_hibyte = _never_hibyte if ascii_only else _has_hibyte
+    for cluster_idx, cluster in enumerate(clusters):
+        if not _check_cluster(cluster, cluster_idx, file_name, errors, warnings,
+                              hibyte_hits, has_hibyte, fail_fast):
+            valid = False
+            if fail_fast:
+                break
+
+    if hibyte_hits:
+        warnings.append(
+            f"'{file_name}' has {len(hibyte_hits)} response field(s) with invisible "
+            f"unicode characters that will be removed (first: {hibyte_hits[0]})")
+
+    return valid, errors, warnings
+
+
+def _check_cluster(cluster: Dict, cluster_idx: int, file_name: str,
+                   errors: List[str], warnings: List[str],
+                   hibyte_hits: List[str], has_hibyte=_has_hibyte,
+                   fail_fast: bool = False) -> bool:
+    """Validate a single cluster."""
+    add_error = errors.append
+    add_warning = warnings.append
+    loc = f"Cluster {cluster_idx} in '{file_name}'"
+    if not type(cluster) is dict:
+        add_error(f"{loc} is not an object")
+        return False
+
+    if 'stims' not in cluster:
+        add_error(f"{loc} missing 'stims' array")
+        return False
+
+    stims = cluster['stims']
+    if not type(stims) is list or not stims:
+        add_error(f"{loc} has invalid or empty stims array")
+        return False
+
+    valid = True
+
+    # Check for duplicate correctResponses, stopping at the first repeat
+    seen_responses = set()
+    for stim in stims:
+        if type(stim) is dict and 'response' in stim and 'correctResponse' in stim['response']:
+            correct_response = stim['response']['correctResponse']
+            if correct_response in seen_responses:
+                add_error(f"Duplicate correctResponse values in cluster {cluster_idx} of '{file_name}'")
+                if fail_fast:
+                    return False
+                valid = False
+                break
+            seen_responses.add(correct_response)
+
+    # Validate each stimulus, accumulating validity across the walk
+    for stim_idx, stim in enumerate(stims):
+        if not _check_stimulus(stim, stim_idx, cluster_idx, file_name, errors, warnings,
+                               hibyte_hits, has_hibyte):
+            if fail_fast:
+                return False
+            valid = False
+
+    # Validate cluster-level fields
+    if 'responseType' in cluster:
+        response_type = cluster['responseType']
+        if not type(response_type) is str:
+            add_error(f"{loc} responseType must be a string")
+            if fail_fast:
+                return False
+            valid = False
+        elif response_type not in _VALID_RESPONSE_TYPES:
+            add_warning(f"{loc} responseType '{response_type}' is not a standard type (expected: {_VALID_RESPONSE_TYPES_MSG})")
+
+    return valid
+
+
+def _check_stimulus(stim: Dict, stim_idx: int, cluster_idx: int, file_name: str,
+                    errors: List[str], warnings: List[str],
+                    hibyte_hits: List[str], has_hibyte=_has_hibyte) -> bool:
+    """Validate a single stimulus."""
+    add_error = errors.append
+    add_warning = warnings.append
+    loc = f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}'"
+    if not type(stim) is dict:
+        add_error(f"{loc} is not an object")
+        return False
+
+    # Validate response object more thoroughly
+    if 'response' not in stim:
+        add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' missing response object")
+        return False
+
+    response = stim['response']
+    if not type(response) is dict:
+        add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' response is not an object")
+        return False
+
+    if 'correctResponse' not in response:
+        add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' missing correctResponse")
+        return False
+
+    # Check for invisible unicode characters that will be removed
+    correct_response = response['correctResponse']
+    if correct_response.__class__ is not str:
+        correct_response = str(correct_response)
+    if correct_response and has_hibyte(correct_response):
+        hibyte_hits.append(f"stim {stim_idx} in cluster {cluster_idx} correctResponse")
+
+    # Check incorrectResponses if present
+    if 'incorrectResponses' in response:
+        incorrect_responses = response['incorrectResponses']
+        if type(incorrect_responses) is str:
+            # String format - should be comma-separated
+            if has_hibyte(incorrect_responses):
+                hibyte_hits.append(f"stim {stim_idx} in cluster {cluster_idx} incorrectResponses")
+            pass  # Valid
+        elif type(incorrect_responses) is list:
+            # Array format - check all elements are strings
+            for i, ir in enumerate(incorrect_responses):
+                if not type(ir) is str:
+                    add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' incorrectResponses[{i}] is not a string")
+                    return False
+                if has_hibyte(ir):
+                    hibyte_hits.append(f"stim {stim_idx} in cluster {cluster_idx} incorrectResponses[{i}]")
+        else:
+            add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' incorrectResponses must be a string or array")
+            return False
+    else:
+        # Check if incorrectResponses should be present
+        # For assessment-type questions, incorrectResponses are typically expected
+        display = stim.get('display')
+        display_text = display.get('text', "") if type(display) is dict else ""
+
+        # Warn if this appears to be a multiple-choice question but lacks incorrectResponses
+        if display_text and _QUESTION_RE.search(display_text):
+            add_warning(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' appears to be a question but missing incorrectResponses")
+
+    # Validate display fields
+    display = stim.get('display')
+    if display is not None:
+        if not type(display) is dict:
+            add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' display is not an object")
+            return False
+
+        # Check field types in one pass over the fields actually present
+        for field, value in display.items():
+            if field in _DISPLAY_FIELDS and not type(value) is str:
+                add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' display.{field} is not a string")
+                return False
+
+    # Validate parameter field (used for probability calculations)
+    if 'parameter' in stim:
+        param = stim['parameter']
+        if not type(param) is str:
+            add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' parameter must be a string")
+            return False
+        # Should be in format like "0,.7"
+        if not _PARAM_RE.match(param):
+            add_warning(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' parameter '{param}' does not match expected format 'number,number'")
+
+    # Validate optimalProb field (required for some delivery methods)
+    if 'optimalProb' in stim:
+        optimal_prob = stim['optimalProb']
+        if not isinstance(optimal_prob, (int, float)):
+            add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' optimalProb must be a number")
+            return False
+
+    # Validate optional fields
+    for field in _OPTIONAL_STR_FIELDS:
+        if field in stim and not type(stim[field]) is str:
+            add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' {field} must be a string")
+            return False
+
+    for field in _OPTIONAL_ARR_FIELDS:
+        if field in stim and not type(stim[field]) is list:
+            add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' {field} must be an array")
+            return False
+
+    return True
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_clusterlist_indices(clusterlist: str) -> Tuple[int, ...]:
+    """Parse a space-separated clusterlist into sorted unique indices.
+
+    The same string is parsed by the session validators and again during
+    timeline generation, so results are memoized; tuples keep the cached
+    values immutable. The cache is cleared when a validator closes.
+    """
+    indices: set = set()
+    for part in clusterlist.split():
+        m = _CLUSTERLIST_TOKEN_RE.fullmatch(part)
+        if not m:
+            continue
+        lo = int(m[1])
+        hi = int(m[2]) if m[2] else lo
+        # set.update over a range object expands at C speed
+        indices.update(range(lo, hi + 1))
+    return tuple(sorted(indices))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_clusterlist(clusterlist: str) -> Tuple[bool, Tuple[int, ...]]:
+    """Validate and extract a clusterlist in one memoized call.
+
+    Grammar checking is comma-based while index extraction is
+    space-based - a long-standing quirk both halves of the tool rely on -
+    so the two scans stay separate internally, but callers get one cached
+    (ok, indices) result per distinct string.
+    """
+    if not _clusterlist_format_ok(clusterlist):
+        return False, ()
+    return True, _parse_clusterlist_indices(clusterlist)
+
+
+# The handful of entities MoFaCTS authoring tools emit in display text.
+# Multi-character entities rule out str.translate, so one compiled
+# pattern with a dict-driven callback keeps decoding to a single pass.
+_ENTITY_MAP = {'amp': '&', 'lt': '<', 'gt': '>', 'quot': '"', '#39': "'"}
+_ENTITY_RE = re.compile(r'&(amp|lt|gt|quot|#39);')
+
+
+def _decode_entities(s: str) -> str:
+    """Decode common HTML entities in question text, one linear pass."""
+    if '&' not in s:
+        return s
+    return _ENTITY_RE.sub(lambda m: _ENTITY_MAP[m.group(1)], s)
+
+
+def _handle_select_response(response: Dict, details: Dict) -> None:
+    """Fill question details for an explicit selectone/selectmultiple response."""
+    details['answer_type'] = 'multiple_choice'
+    options = response.get('options', [])
+    details['has_options'] = len(options) > 0
+    details['num_options'] = len(options)
+
+    if not options:
+        details['warnings'].append(f'⚠ Multiple-choice question has no options')
+    elif len(options) < 2:
+        details['warnings'].append(f'⚠ Multiple-choice question needs at least 2 options (has {len(options)})')
+
+    # Extract choice text. Stored as three parallel lists rather than a
+    # dict per option: one small PyObject per field instead of a 3-key
+    # dict allocation for every choice.
+    if options:
+        ids: List[str] = []
+        texts: List[str] = []
+        flags: List[bool] = []
+        has_correct = False
+        correct_id = response.get('correctResponse')
+        for opt in options:
+            # Duck-typed: one getattr instead of an isinstance MRO walk,
+            # and the bound .get serves every probe below.
+            opt_get = getattr(opt, 'get', None)
+            if opt_get is not None:
+                choice_id = opt_get('id', '')
+                is_correct = (choice_id == correct_id)
+                if is_correct:
+                    has_correct = True
+                ids.append(choice_id)
+                texts.append(opt_get('text', opt_get('id', 'N/A')))
+                flags.append(is_correct)
+            else:
+                ids.append('')
+                texts.append(str(opt))
+                flags.append(False)
+        details['choice_ids'] = ids
+        details['choice_texts'] = texts
+        details['choice_correct_flags'] = flags
+
+        if not has_correct:
+            details['warnings'].append(f'⚠ No option marked as correct answer')
+
+
+def _handle_text_response(response: Dict, details: Dict) -> None:
+    """Fill question details for a text-style response (or inferred multiple choice)."""
+    if 'correctResponse' not in response:
+        return
+    incorrect_list = response.get('incorrectResponses')
+    if isinstance(incorrect_list, list) and len(incorrect_list) > 0:
+        # Treat as multiple choice even though type says text
+        details['answer_type'] = 'multiple_choice'
+        details['has_options'] = True
+        # Build choices: correct first, then incorrect
+        num_choices = 1 + len(incorrect_list)
+        details['choice_ids'] = ['correct'] + [f'inc{idx}' for idx in range(len(incorrect_list))]
+        details['choice_texts'] = [str(response['correctResponse'])] + [str(inc) for inc in incorrect_list]
+        details['choice_correct_flags'] = [True] + [False] * len(incorrect_list)
+        details['num_options'] = num_choices
+        details['warnings'].append("⚠ Inferred multiple-choice (correctResponse + incorrectResponses) but response.type='text'")
+    else:
+        # Plain text input
+        details['answer_type'] = 'text_input'
+        details['correct_answer'] = str(response['correctResponse'])
+
+
+# Question-details handler per response type; anything unlisted falls
+# back to the text handler.
+_RESPONSE_HANDLERS = {
+    'selectone': _handle_select_response,
+    'selectmultiple': _handle_select_response,
+}
+
+
+def _strip_html(s: str) -> str:
+    """Strip markup from question text with one linear scan.
+
+    Does the job of re.sub(r'<[^<]+?>', ...) without regex-engine
+    backtracking: a '<' only starts a tag when a matching '>' actually
+    follows (with no '<' in between); otherwise it is kept verbatim, so
+    math/comparison prompts like 'Is 3 < 4?' survive intact. Tag-free
+    strings (the common case) are returned untouched.
+    """
+    if '<' not in s:
+        return s
+    out = []
+    append = out.append
+    find = s.find
+    i = 0
+    n = len(s)
+    while i < n:
+        lt = find('<', i)
+        if lt == -1:
+            append(s[i:])
+            break
+        append(s[i:lt])
+        # A tag needs at least one char between '<' and its closing '>'
+        # (which may itself be '>'), with no '<' in between
+        gt = find('>', lt + 2)
+        next_lt = find('<', lt + 1)
+        if gt != -1 and (next_lt == -1 or gt < next_lt):
+            # Proper <...> tag: drop it
+            i = gt + 1
+        else:
+            # No closing '>' before the end or the next '<': not a tag
+            append('<')
+            i = lt + 1
+    return ''.join(out)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_adaptive_rule(rule: str) -> Tuple[Optional[str], Optional[str], Tuple[Tuple[int, int], ...]]:
+    """Split an adaptive rule into (condition, action, C#S# refs), cached.
+
+    Validation and timeline generation both parse the same rule strings;
+    memoizing on the string means each rule is split and scanned once per
+    run. Returns (None, None, ()) when the rule has no THEN clause.
+    """
+    parts = rule.split('THEN', 1)
+    if len(parts) < 2:
+        return None, None, ()
+    condition = parts[0].strip()
+    action = parts[1].strip()
+    refs = tuple((int(c), int(s)) for c, s in _ADAPTIVE_REF_RE.findall(action))
+    return condition, action, refs
+
+
+def _iter_units(tdf_content: Dict) -> Iterator[Dict]:
+    """Yield a TDF's units, normalizing the single-object form.
+
+    Replaces the units-list normalization block repeated across the
+    session validators and timeline generation; avoids the throwaway {}
+    from tdf_content.get('tutor', {}) on every call.
+    """
+    tutor = tdf_content.get('tutor')
+    if not tutor:
+        return
+    unit_data = tutor.get('unit')
+    if unit_data is None:
+        return
+    if isinstance(unit_data, list):
+        yield from unit_data
+    else:
+        yield unit_data
+
+
+def _clusterlist_format_ok(clusterlist: str) -> bool:
+    """Validate clusterlist format (e.g., '1,2,3-5,7')"""
+    if not _CLUSTERLIST_RE.match(clusterlist):
+        return False
+    # Grammar is valid; only now check range ordering
+    for match in _RANGE_RE.finditer(clusterlist):
+        if int(match.group(1)) > int(match.group(2)):
+            return False
+    return True
+
+
+def _check_tdf_file(content: Dict, file_name: str) -> Tuple[bool, List[str], List[str]]:
+    """Validate a single TDF file.
+
+    Pure function (no shared state) so it can run in a worker process;
+    returns (valid, errors, warnings) for the caller to merge.
+    """
+    errors: List[str] = []
+    warnings: List[str] = []
+    add_error = errors.append
+    add_warning = warnings.append
+
+    if _tdf_schema_check is not None:
+        try:
+            _tdf_schema_check(content)
+        except _fastjsonschema.JsonSchemaException as e:
+            add_error(f"TDF '{file_name}' failed schema validation: {e.message}")
+            return False, errors, warnings
+        tutor = content['tutor']
+        if 'unit' not in tutor and 'unitTemplate' not in tutor:
+            add_warning(f"TDF '{file_name}' has no unit or unitTemplate - this may be a root TDF")
+        units = list(tutor.get('unit', ())) + list(tutor.get('unitTemplate', ()))
+        for unit_idx, unit in enumerate(units):
+            assess_session = unit.get('assessmentsession')
+            if assess_session and 'clusterlist' in assess_session:
+                if not _clusterlist_format_ok(assess_session['clusterlist']):
+                    add_error(f"TDF '{file_name}' unit {unit_idx} assessmentsession.clusterlist has invalid format")
+                    return False, errors, warnings
+        return True, errors, warnings
+
+    # Check tutor.setspec
+    if 'tutor' not in content or 'setspec' not in content['tutor']:
+        add_error(f"TDF '{file_name}' missing tutor.setspec")
+        return False, errors, warnings
+
+    setspec = content['tutor']['setspec']
+
+    # Check lessonname
+    if 'lessonname' not in setspec or not isinstance(setspec['lessonname'], str) or not setspec['lessonname'].strip():
+        add_error(f"TDF '{file_name}' missing or invalid lessonname")
+        return False, errors, warnings
+
+    # Check stimulusfile
+    if 'stimulusfile' not in setspec or not isinstance(setspec['stimulusfile'], str):
+        add_error(f"TDF '{file_name}' missing or invalid stimulusfile")
+        return False, errors, warnings
+
+    # Check for experimentTarget and ensure it's lowercase if present
+    if 'experimentTarget' in setspec:
+        if not isinstance(setspec['experimentTarget'], str):
+            add_error(f"TDF '{file_name}' experimentTarget is not a string")
+            return False, errors, warnings
+        # Note: In the JS code, experimentTarget gets lowercased during processing
+
+    # Check for unit or unitTemplate
+    tutor = content['tutor']
+    if 'unit' not in tutor and 'unitTemplate' not in tutor:
+        add_warning(f"TDF '{file_name}' has no unit or unitTemplate - this may be a root TDF")
+
+    # Check for expected TDF structure to prevent runtime errors
+    tutor = content.get('tutor')
+    if not tutor:
+        add_error(f"TDF '{file_name}' missing tutor object")
+        return False, errors, warnings
+
+    if not isinstance(tutor, dict):
+        add_error(f"TDF '{file_name}' tutor is not an object")
+        return False, errors, warnings
+
+    # Validate units and unitTemplates
+    units = []
+    if 'unit' in tutor:
+        unit_data = tutor['unit']
+        if not isinstance(unit_data, list):
+            add_error(f"TDF '{file_name}' tutor.unit must be an array")
+            return False, errors, warnings
+        units.extend(unit_data)
+
+    if 'unitTemplate' in tutor:
+        unit_template_data = tutor['unitTemplate']
+        if not isinstance(unit_template_data, list):
+            add_error(f"TDF '{file_name}' tutor.unitTemplate must be an array")
+            return False, errors, warnings
+        units.extend(unit_template_data)
+
+    # Validate each unit
+    for unit_idx, unit in enumerate(units):
+        if not isinstance(unit, dict):
+            add_error(f"TDF '{file_name}' unit {unit_idx} is not an object")
+            return False, errors, warnings
+
+        # Check for clusterIndex if present
+        if 'clusterIndex' in unit:
+            cluster_index = unit['clusterIndex']
+            if not isinstance(cluster_index, (int, str)):
+                add_error(f"TDF '{file_name}' unit {unit_idx} clusterIndex must be a number or string")
+                return False, errors, warnings
+
+        # Validate assessmentsession if present
+        if 'assessmentsession' in unit:
+            assess_session = unit['assessmentsession']
+            if not isinstance(assess_session, dict):
+                add_error(f"TDF '{file_name}' unit {unit_idx} assessmentsession must be an object")
+                return False, errors, warnings
+
+            if 'clusterlist' in assess_session:
+                clusterlist = assess_session['clusterlist']
+                if not isinstance(clusterlist, str):
+                    add_error(f"TDF '{file_name}' unit {unit_idx} assessmentsession.clusterlist must be a string")
+                    return False, errors, warnings
+                # Validate clusterlist format (comma-separated numbers/ranges)
+                if not _clusterlist_format_ok(clusterlist):
+                    add_error(f"TDF '{file_name}' unit {unit_idx} assessmentsession.clusterlist has invalid format")
+                    return False, errors, warnings
+
+    return True, errors, warnings
 
 
 class PackageValidator:
     """Validates MoFaCTS zip packages with comprehensive checks."""
 
-    def __init__(self, zip_path: str, verbose: bool = False):
+    __slots__ = (
+        'zip_path', 'verbose', 'fail_fast', 'errors', 'warnings',
+        '_flushed_errors', '_flushed_warnings',
+        'files', 'tdf_files', 'stim_files', 'media_files',
+        '_scratch', '_zip', '_stim_by_name', '_tdf_stim_name', '_stim_cluster_count',
+        '_tdf_spans', '_tdf_units', '_question_details',
+    )
+
+    def __init__(self, zip_path: str, verbose: bool = False, fail_fast: bool = False):
         self.zip_path = zip_path
         self.verbose = verbose
+        # Stop at the first invalid stim per file instead of collecting all
+        # diagnostics; off by default so users see every error in one run.
+        self.fail_fast = fail_fast
         self.errors: List[str] = []
         self.warnings: List[str] = []
-        self.files: Dict[str, Dict] = {}
-        self.tdf_files: List[Dict] = []
-        self.stim_files: List[Dict] = []
-        self.media_files: List[Dict] = []
-
-    def log(self, message: str):
+        self._flushed_errors = 0
+        self._flushed_warnings = 0
+        self.files: Dict[str, FileMeta] = {}
+        self.tdf_files: List[FileMeta] = []
+        self.stim_files: List[FileMeta] = []
+        self.media_files: List[FileMeta] = []
+        # Reusable read buffer for small zip members (single-threaded use only).
+        self._scratch = bytearray(1 << 20)
+        # Archive handle, kept open for the validator's lifetime so members
+        # can be re-read without reopening the zip (see close()).
+        self._zip: Optional[zipfile.ZipFile] = None
+        # Lookup indexes built once after extraction (see _build_indexes).
+        self._stim_by_name: Dict[str, FileMeta] = {}
+        self._tdf_stim_name: Dict[str, Optional[str]] = {}
+        self._stim_cluster_count: Dict[str, int] = {}
+        # Cluster spans parsed lazily, once per TDF (keyed by member path).
+        self._tdf_spans: Dict[str, List[Tuple[int, int]]] = {}
+        # Flat (tdf_file, unit_idx, unit) walk, built on first use.
+        self._tdf_units: Optional[List[Tuple[FileMeta, int, Dict]]] = None
+        self._question_details: Dict[Tuple[str, int], Dict] = {}
+
+    def log(self, message: str) -> None:
         """Log message if verbose mode is enabled."""
         if self.verbose:
             print(message)
 
-    def add_error(self, message: str):
+    def add_error(self, message: str) -> None:
         """Add an error message."""
         self.errors.append(message)
-        print(f"ERROR: {message}")
 
-    def add_warning(self, message: str):
+    def add_warning(self, message: str) -> None:
         """Add a warning message."""
         self.warnings.append(message)
-        print(f"WARNING: {message}")
+
+    def flush_diagnostics(self) -> None:
+        """Emit errors/warnings accumulated since the last flush in one write."""
+        batch = ['ERROR: ' + m for m in self.errors[self._flushed_errors:]]
+        batch.extend('WARNING: ' + m for m in self.warnings[self._flushed_warnings:])
+        if batch:
+            sys.stdout.write('\n'.join(batch) + '\n')
+        self._flushed_errors = len(self.errors)
+        self._flushed_warnings = len(self.warnings)
+
+    def close(self) -> None:
+        """Close the archive handle if it is still open."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        _parse_clusterlist_indices.cache_clear()
+        _parse_clusterlist.cache_clear()
+        _parse_adaptive_rule.cache_clear()
 
     def validate_zip_exists(self) -> bool:
         """Check if the zip file exists."""
@@ -54,45 +945,45 @@ class PackageValidator:
     def extract_and_categorize_files(self) -> bool:
         """Extract zip and categorize files."""
         try:
-            with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-                for file_info in zip_ref.filelist:
-                    file_path = file_info.filename
-                    file_name = os.path.basename(file_path)
-                    file_ext = os.path.splitext(file_name)[1].lower()
+            zip_ref = self._zip = zipfile.ZipFile(self.zip_path, 'r')
+            json_entries = []
+            for file_info in zip_ref.infolist():
+                # Skip directory entries (which would otherwise be counted
+                # as media files) and zero-byte members
+                if file_info.is_dir() or file_info.file_size == 0:
+                    continue
 
-                    # Read file contents
-                    try:
-                        with zip_ref.open(file_info) as f:
-                            if file_ext == '.json':
-                                content = json.loads(f.read().decode('utf-8'))
-                                file_type = 'stim' if 'setspec' in content else 'tdf'
-                            else:
-                                content = f.read()
-                                file_type = 'media'
-                    except json.JSONDecodeError as e:
-                        self.add_error(f"Invalid JSON in file {file_path}: {e}")
-                        continue
-                    except Exception as e:
-                        self.add_error(f"Error reading file {file_path}: {e}")
-                        continue
+                file_path = file_info.filename
+                # Plain string ops instead of os.path calls in the hot loop
+                file_name = file_path.rpartition('/')[2]
+                dot = file_name.rfind('.')
+                file_ext = file_name[dot:].lower() if dot > 0 else ''
 
-                    file_meta = {
-                        'name': file_name,
-                        'path': file_path,
-                        'extension': file_ext,
-                        'content': content,
-                        'type': file_type
-                    }
+                if file_ext == '.json':
+                    # Defer reading so decoding can batch (and
+                    # parallelize) below.
+                    json_entries.append((file_path, file_name, file_ext, file_info))
+                    continue
 
-                    self.files[file_path] = file_meta
+                # Media files are only ever referenced by name downstream,
+                # so skip reading their (potentially large) contents.
+                self._register_file(file_name, file_path, file_ext, None, 'media')
 
-                    if file_type == 'tdf':
-                        self.tdf_files.append(file_meta)
-                    elif file_type == 'stim':
-                        self.stim_files.append(file_meta)
-                    elif file_type == 'media':
-                        self.media_files.append(file_meta)
+            for (file_path, file_name, file_ext, _), (content, error, ascii_only) in zip(
+                    json_entries, self._decode_json_members(zip_ref, [e[3] for e in json_entries])):
+                if error is not None:
+                    self.add_error(error)
+                    continue
+                if not isinstance(content, dict):
+                    # Non-object JSON (scalar/array) can't be categorized;
+                    # report it per file and keep going like other bad members
+                    self.add_error(f"Error reading file {file_path}: top-level JSON value is not an object")
+                    continue
+                file_type = 'stim' if 'setspec' in content else 'tdf'
+                self._register_file(file_name, file_path, file_ext, content, file_type,
+                                    ascii_only)
 
+            self._build_indexes()
             self.log(f"Found {len(self.tdf_files)} TDF files, {len(self.stim_files)} stimulus files, {len(self.media_files)} media files")
             return True
 
@@ -103,6 +994,81 @@ class PackageValidator:
             self.add_error(f"Error extracting zip: {e}")
             return False
 
+    def _decode_json_members(self, zip_ref: zipfile.ZipFile,
+                             json_infos: List[zipfile.ZipInfo]) -> List[Tuple[Optional[Any], Optional[str], bool]]:
+        """Read and decode JSON members as (content, error, ascii_only) triples.
+
+        Small packages decode inline, reusing a preallocated scratch buffer so
+        each small member avoids a fresh bytes allocation. Larger packages
+        bulk-read and decode in parallel across cores (worker processes need
+        their own copy of the bytes, so the scratch buffer does not apply).
+        """
+        results: List[Tuple[Optional[Any], Optional[str], bool]] = []
+
+        if len(json_infos) < _PARALLEL_JSON_THRESHOLD:
+            scratch = self._scratch
+            for file_info in json_infos:
+                try:
+                    if file_info.file_size <= len(scratch):
+                        with zip_ref.open(file_info) as f:
+                            n = f.readinto(scratch)
+                        raw = memoryview(scratch)[:n]
+                    else:
+                        # One-shot read; skips the ZipExtFile buffering layers
+                        raw = zip_ref.read(file_info)
+                except Exception as e:
+                    results.append((None, f"Error reading file {file_info.filename}: {e}", True))
+                    continue
+                content, error, ascii_only = _parse_json_member(raw)
+                if error is not None:
+                    error = f"Invalid JSON in file {file_info.filename}: {error}"
+                results.append((content, error, ascii_only))
+            return results
+
+        entries = []
+        for file_info in json_infos:
+            try:
+                entries.append((file_info, zip_ref.read(file_info)))
+            except Exception as e:
+                entries.append((file_info, e))
+
+        raws = [raw for _, raw in entries if not isinstance(raw, Exception)]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            decoded = iter(list(executor.map(_parse_json_member, raws, chunksize=32)))
+
+        for file_info, raw in entries:
+            if isinstance(raw, Exception):
+                results.append((None, f"Error reading file {file_info.filename}: {raw}", True))
+                continue
+            content, error, ascii_only = next(decoded)
+            if error is not None:
+                error = f"Invalid JSON in file {file_info.filename}: {error}"
+            results.append((content, error, ascii_only))
+        return results
+
+    def _register_file(self, file_name: str, file_path: str, file_ext: str,
+                       content: Any, file_type: str, ascii_only: bool = False):
+        """Record a categorized zip member in the file indexes."""
+        file_meta = FileMeta(file_name, file_path, file_ext, content, file_type, ascii_only)
+
+        self.files[file_path] = file_meta
+
+        if file_type == 'tdf':
+            self.tdf_files.append(file_meta)
+        elif file_type == 'stim':
+            self.stim_files.append(file_meta)
+        elif file_type == 'media':
+            self.media_files.append(file_meta)
+
+    def _build_indexes(self):
+        """Build O(1) lookup indexes so validators avoid repeated linear scans."""
+        self._stim_by_name = {s.name: s for s in self.stim_files}
+        self._tdf_stim_name = {t.path: self._get_stimulus_file_from_tdf(t.content)
+                               for t in self.tdf_files}
+        for stim in self.stim_files:
+            clusters = stim.content.get('setspec', {}).get('clusters')
+            self._stim_cluster_count[stim.name] = len(clusters) if isinstance(clusters, list) else 0
+
     def validate_package_structure(self) -> bool:
         """Validate overall package structure."""
         if not self.tdf_files:
@@ -116,8 +1082,8 @@ class PackageValidator:
         # Check for at least one TDF-stim pair
         valid_pairs = 0
         for tdf in self.tdf_files:
-            stim_file_name = self._get_stimulus_file_from_tdf(tdf['content'])
-            if stim_file_name and any(stim['name'] == stim_file_name for stim in self.stim_files):
+            stim_file_name = self._tdf_stim_name.get(tdf.path)
+            if stim_file_name and stim_file_name in self._stim_by_name:
                 valid_pairs += 1
 
         if valid_pairs == 0:
@@ -130,346 +1096,77 @@ class PackageValidator:
         """Validate JSON structure and required fields."""
         valid = True
 
-        # Validate stimulus files
-        for stim_file in self.stim_files:
-            if not self._validate_stimulus_file(stim_file):
-                valid = False
-
-        # Validate TDF files
-        for tdf_file in self.tdf_files:
-            if not self._validate_tdf_file(tdf_file):
-                valid = False
-
-        return valid
-
-    def _validate_stimulus_file(self, stim_file: Dict) -> bool:
-        """Validate a single stimulus file."""
-        content = stim_file['content']
-        file_name = stim_file['name']
-
-        # Check setspec exists
-        if 'setspec' not in content:
-            self.add_error(f"Stimulus file '{file_name}' missing 'setspec' key")
-            return False
-
-        setspec = content['setspec']
-
-        # Check clusters array
-        if 'clusters' not in setspec:
-            self.add_error(f"Stimulus file '{file_name}' missing 'clusters' in setspec")
-            return False
-
-        clusters = setspec['clusters']
-        if not isinstance(clusters, list):
-            self.add_error(f"Stimulus file '{file_name}' clusters is not an array")
-            return False
-
-        if not clusters:
-            self.add_error(f"Stimulus file '{file_name}' has no clusters")
-            return False
-
-        # Validate each cluster
-        for cluster_idx, cluster in enumerate(clusters):
-            if not self._validate_cluster(cluster, cluster_idx, file_name):
-                return False
-
-        return True
-
-    def _validate_cluster(self, cluster: Dict, cluster_idx: int, file_name: str) -> bool:
-        """Validate a single cluster."""
-        if not isinstance(cluster, dict):
-            self.add_error(f"Cluster {cluster_idx} in '{file_name}' is not an object")
-            return False
-
-        if 'stims' not in cluster:
-            self.add_error(f"Cluster {cluster_idx} in '{file_name}' missing 'stims' array")
-            return False
-
-        stims = cluster['stims']
-        if not isinstance(stims, list) or not stims:
-            self.add_error(f"Cluster {cluster_idx} in '{file_name}' has invalid or empty stims array")
-            return False
-
-        # Check for duplicate correctResponses
-        correct_responses = []
-        for stim in stims:
-            if isinstance(stim, dict) and 'response' in stim and 'correctResponse' in stim['response']:
-                correct_responses.append(stim['response']['correctResponse'])
-
-        if len(correct_responses) != len(set(correct_responses)):
-            self.add_error(f"Duplicate correctResponse values in cluster {cluster_idx} of '{file_name}'")
-            return False
-
-        # Validate each stimulus
-        for stim_idx, stim in enumerate(stims):
-            if not self._validate_stimulus(stim, stim_idx, cluster_idx, file_name):
-                return False
-
-        # Validate cluster-level fields
-        if 'responseType' in cluster:
-            response_type = cluster['responseType']
-            if not isinstance(response_type, str):
-                self.add_error(f"Cluster {cluster_idx} in '{file_name}' responseType must be a string")
-                return False
-            valid_response_types = ['text', 'audio', 'image', 'video', 'cloze']
-            if response_type not in valid_response_types:
-                self.add_warning(f"Cluster {cluster_idx} in '{file_name}' responseType '{response_type}' is not a standard type (expected: {', '.join(valid_response_types)})")
-
-        return True
-
-    def _validate_stimulus(self, stim: Dict, stim_idx: int, cluster_idx: int, file_name: str) -> bool:
-        """Validate a single stimulus."""
-        if not isinstance(stim, dict):
-            self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' is not an object")
-            return False
-
-        # Validate response object more thoroughly
-        if 'response' not in stim:
-            self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' missing response object")
-            return False
-
-        response = stim['response']
-        if not isinstance(response, dict):
-            self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' response is not an object")
-            return False
-
-        if 'correctResponse' not in response:
-            self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' missing correctResponse")
-            return False
-
-        # Check for invisible unicode characters that will be removed
-        correct_response = str(response['correctResponse'])
-        if re.search(r'[\u0080-\u00FF]', correct_response):
-            self.add_warning(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' correctResponse contains invisible unicode characters that will be removed")
-
-        # Check incorrectResponses if present
-        if 'incorrectResponses' in response:
-            incorrect_responses = response['incorrectResponses']
-            if isinstance(incorrect_responses, str):
-                # String format - should be comma-separated
-                if re.search(r'[\u0080-\u00FF]', incorrect_responses):
-                    self.add_warning(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' incorrectResponses string contains invisible unicode characters that will be removed")
-                pass  # Valid
-            elif isinstance(incorrect_responses, list):
-                # Array format - check all elements are strings
-                for i, ir in enumerate(incorrect_responses):
-                    if not isinstance(ir, str):
-                        self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' incorrectResponses[{i}] is not a string")
-                        return False
-                    if re.search(r'[\u0080-\u00FF]', str(ir)):
-                        self.add_warning(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' incorrectResponses[{i}] contains invisible unicode characters that will be removed")
-            else:
-                self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' incorrectResponses must be a string or array")
-                return False
+        # Validate stimulus files, in parallel when there are enough of them
+        # to pay for process-pool startup
+        if len(self.stim_files) >= _PARALLEL_VALIDATE_THRESHOLD:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(
+                    _check_stimulus_file,
+                    [s.content for s in self.stim_files],
+                    [s.name for s in self.stim_files],
+                    [s.ascii_only for s in self.stim_files],
+                    [self.fail_fast] * len(self.stim_files)))
+            for file_valid, errors, warnings in results:
+                self.errors.extend(errors)
+                self.warnings.extend(warnings)
+                if not file_valid:
+                    valid = False
         else:
-            # Check if incorrectResponses should be present
-            # For assessment-type questions, incorrectResponses are typically expected
-            display_text = ""
-            if 'display' in stim and 'text' in stim['display']:
-                display_text = stim['display']['text']
-
-            # Warn if this appears to be a multiple-choice question but lacks incorrectResponses
-            if any(indicator in display_text.lower() for indicator in ['?', 'choose', 'select', 'which', 'what is']):
-                self.add_warning(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' appears to be a question but missing incorrectResponses")
-
-        # Validate display fields
-        if 'display' in stim:
-            display = stim['display']
-            if not isinstance(display, dict):
-                self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' display is not an object")
-                return False
-
-            # Check field types
-            display_fields = ['text', 'audioSrc', 'imgSrc', 'videoSrc', 'clozeText', 'clozeStimulus', 'textStimulus', 'audioStimulus', 'imageStimulus', 'videoStimulus']
-            for field in display_fields:
-                if field in display and not isinstance(display[field], str):
-                    self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' display.{field} is not a string")
-                    return False
-
-        # Validate response object more thoroughly
-        if 'response' in stim:
-            response = stim['response']
-            if not isinstance(response, dict):
-                self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' response is not an object")
-                return False
+            for stim_file in self.stim_files:
+                if not self._validate_stimulus_file(stim_file):
+                    valid = False
 
-            # Check incorrectResponses if present
-            if 'incorrectResponses' in response:
-                incorrect_responses = response['incorrectResponses']
-                if isinstance(incorrect_responses, str):
-                    # String format - should be comma-separated
-                    pass  # Valid
-                elif isinstance(incorrect_responses, list):
-                    # Array format - check all elements are strings
-                    for i, ir in enumerate(incorrect_responses):
-                        if not isinstance(ir, str):
-                            self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' incorrectResponses[{i}] is not a string")
-                            return False
-                else:
-                    self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' incorrectResponses must be a string or array")
-                    return False
+        # Validate TDF files, with the same parallel dispatch
+        if len(self.tdf_files) >= _PARALLEL_VALIDATE_THRESHOLD:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(
+                    _check_tdf_file,
+                    [t.content for t in self.tdf_files],
+                    [t.name for t in self.tdf_files]))
+            for file_valid, errors, warnings in results:
+                self.errors.extend(errors)
+                self.warnings.extend(warnings)
+                if not file_valid:
+                    valid = False
         else:
-            self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' missing response object")
-            return False
-
-        # Validate parameter field (used for probability calculations)
-        if 'parameter' in stim:
-            param = stim['parameter']
-            if not isinstance(param, str):
-                self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' parameter must be a string")
-                return False
-            # Should be in format like "0,.7"
-            if not re.match(r'^\d+(\.\d+)?,\d+(\.\d+)?$', param):
-                self.add_warning(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' parameter '{param}' does not match expected format 'number,number'")
-
-        # Validate optimalProb field (required for some delivery methods)
-        if 'optimalProb' in stim:
-            optimal_prob = stim['optimalProb']
-            if not isinstance(optimal_prob, (int, float)):
-                self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' optimalProb must be a number")
-                return False
-
-        # Validate optional fields
-        optional_string_fields = ['speechHintExclusionList']
-        for field in optional_string_fields:
-            if field in stim and not isinstance(stim[field], str):
-                self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' {field} must be a string")
-                return False
-
-        optional_array_fields = ['alternateDisplays', 'tags']
-        for field in optional_array_fields:
-            if field in stim and not isinstance(stim[field], list):
-                self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' {field} must be an array")
-                return False
-
-        return True
-
-    def _validate_tdf_file(self, tdf_file: Dict) -> bool:
-        """Validate a single TDF file."""
-        content = tdf_file['content']
-        file_name = tdf_file['name']
-
-        # Check tutor.setspec
-        if 'tutor' not in content or 'setspec' not in content['tutor']:
-            self.add_error(f"TDF '{file_name}' missing tutor.setspec")
-            return False
-
-        setspec = content['tutor']['setspec']
-
-        # Check lessonname
-        if 'lessonname' not in setspec or not isinstance(setspec['lessonname'], str) or not setspec['lessonname'].strip():
-            self.add_error(f"TDF '{file_name}' missing or invalid lessonname")
-            return False
-
-        # Check stimulusfile
-        if 'stimulusfile' not in setspec or not isinstance(setspec['stimulusfile'], str):
-            self.add_error(f"TDF '{file_name}' missing or invalid stimulusfile")
-            return False
-
-        # Check for experimentTarget and ensure it's lowercase if present
-        if 'experimentTarget' in setspec:
-            if not isinstance(setspec['experimentTarget'], str):
-                self.add_error(f"TDF '{file_name}' experimentTarget is not a string")
-                return False
-            # Note: In the JS code, experimentTarget gets lowercased during processing
-
-        # Check for unit or unitTemplate
-        tutor = content['tutor']
-        if 'unit' not in tutor and 'unitTemplate' not in tutor:
-            self.add_warning(f"TDF '{file_name}' has no unit or unitTemplate - this may be a root TDF")
-
-        # Check for expected TDF structure to prevent runtime errors
-        tutor = content.get('tutor')
-        if not tutor:
-            self.add_error(f"TDF '{file_name}' missing tutor object")
-            return False
-
-        if not isinstance(tutor, dict):
-            self.add_error(f"TDF '{file_name}' tutor is not an object")
-            return False
-
-        # Validate units and unitTemplates
-        units = []
-        if 'unit' in tutor:
-            unit_data = tutor['unit']
-            if not isinstance(unit_data, list):
-                self.add_error(f"TDF '{file_name}' tutor.unit must be an array")
-                return False
-            units.extend(unit_data)
-
-        if 'unitTemplate' in tutor:
-            unit_template_data = tutor['unitTemplate']
-            if not isinstance(unit_template_data, list):
-                self.add_error(f"TDF '{file_name}' tutor.unitTemplate must be an array")
-                return False
-            units.extend(unit_template_data)
-
-        # Validate each unit
-        for unit_idx, unit in enumerate(units):
-            if not isinstance(unit, dict):
-                self.add_error(f"TDF '{file_name}' unit {unit_idx} is not an object")
-                return False
-
-            # Check for clusterIndex if present
-            if 'clusterIndex' in unit:
-                cluster_index = unit['clusterIndex']
-                if not isinstance(cluster_index, (int, str)):
-                    self.add_error(f"TDF '{file_name}' unit {unit_idx} clusterIndex must be a number or string")
-                    return False
+            for tdf_file in self.tdf_files:
+                if not self._validate_tdf_file(tdf_file):
+                    valid = False
 
-            # Validate assessmentsession if present
-            if 'assessmentsession' in unit:
-                assess_session = unit['assessmentsession']
-                if not isinstance(assess_session, dict):
-                    self.add_error(f"TDF '{file_name}' unit {unit_idx} assessmentsession must be an object")
-                    return False
+        return valid
 
-                if 'clusterlist' in assess_session:
-                    clusterlist = assess_session['clusterlist']
-                    if not isinstance(clusterlist, str):
-                        self.add_error(f"TDF '{file_name}' unit {unit_idx} assessmentsession.clusterlist must be a string")
-                        return False
-                    # Validate clusterlist format (comma-separated numbers/ranges)
-                    if not self._validate_clusterlist_format(clusterlist):
-                        self.add_error(f"TDF '{file_name}' unit {unit_idx} assessmentsession.clusterlist has invalid format")
-                        return False
+    def _validate_stimulus_file(self, stim_file: FileMeta) -> bool:
+        """Validate a single stimulus file, merging results into this validator."""
+        valid, errors, warnings = _check_stimulus_file(
+            stim_file.content, stim_file.name, stim_file.ascii_only, self.fail_fast)
+        self.errors.extend(errors)
+        self.warnings.extend(warnings)
+        return valid
 
-        return True
+    def _validate_tdf_file(self, tdf_file: FileMeta) -> bool:
+        """Validate a single TDF file, merging results into this validator."""
+        valid, errors, warnings = _check_tdf_file(tdf_file.content, tdf_file.name)
+        self.errors.extend(errors)
+        self.warnings.extend(warnings)
+        return valid
 
     def _validate_clusterlist_format(self, clusterlist: str) -> bool:
         """Validate clusterlist format (e.g., '1,2,3-5,7')"""
-        parts = clusterlist.split(',')
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-            if '-' in part:
-                try:
-                    start, end = map(int, part.split('-'))
-                    if start > end:
-                        return False
-                except ValueError:
-                    return False
-            else:
-                try:
-                    int(part)
-                except ValueError:
-                    return False
-        return True
+        return _clusterlist_format_ok(clusterlist)
 
     def validate_cross_references(self) -> bool:
         """Validate cross-references between TDF and stimulus files."""
         valid = True
 
         for tdf_file in self.tdf_files:
-            stim_file_name = self._get_stimulus_file_from_tdf(tdf_file['content'])
+            stim_file_name = self._tdf_stim_name.get(tdf_file.path)
             if not stim_file_name:
                 continue
 
             # Find corresponding stimulus file
-            stim_file = next((f for f in self.stim_files if f['name'] == stim_file_name), None)
+            stim_file = self._stim_by_name.get(stim_file_name)
             if not stim_file:
-                self.add_error(f"TDF '{tdf_file['name']}' references stimulus file '{stim_file_name}' which was not found")
+                self.add_error(f"TDF '{tdf_file.name}' references stimulus file '{stim_file_name}' which was not found")
                 valid = False
                 continue
 
@@ -505,89 +1202,95 @@ class PackageValidator:
         except KeyError:
             return None
 
-    def _validate_cluster_references(self, tdf_file: Dict, stim_file: Dict) -> bool:
+    def _validate_cluster_references(self, tdf_file: FileMeta, stim_file: FileMeta) -> bool:
         """Validate that cluster indices referenced in TDF exist in stimulus file."""
-        tdf_content = tdf_file['content']
-        stim_content = stim_file['content']
+        tdf_content = tdf_file.content
 
-        cluster_indices = self._extract_cluster_indices_from_tdf(tdf_content)
-        num_clusters = len(stim_content['setspec']['clusters'])
+        num_clusters = self._stim_cluster_count[stim_file.name]
+
+        spans = self._cluster_spans(tdf_file)
 
+        # Well-formed packages pass a single aggregate bounds check; only on
+        # failure walk the spans to name the offending indices.
         valid = True
-        for idx in cluster_indices:
-            if idx < 0 or idx >= num_clusters:
-                self.add_error(f"TDF '{tdf_file['name']}' references cluster index {idx}, but stimulus file '{stim_file['name']}' only has {num_clusters} clusters")
-                valid = False
+        if spans and (min(lo for lo, _ in spans) < 0
+                      or max(hi for _, hi in spans) >= num_clusters):
+            for lo, hi in spans:
+                if lo < 0:
+                    self.add_error(f"TDF '{tdf_file.name}' references cluster index {lo}, but stimulus file '{stim_file.name}' only has {num_clusters} clusters")
+                    valid = False
+                if hi >= num_clusters:
+                    self.add_error(f"TDF '{tdf_file.name}' references cluster index {hi}, but stimulus file '{stim_file.name}' only has {num_clusters} clusters")
+                    valid = False
 
         return valid
 
-    def _extract_cluster_indices_from_tdf(self, tdf: Dict) -> List[int]:
-        """Extract cluster indices referenced in TDF."""
-        indices = set()
+    def _cluster_spans(self, tdf_file: FileMeta) -> List[Tuple[int, int]]:
+        """Return the (lo, hi) spans for a TDF, parsing its units only once."""
+        spans = self._tdf_spans.get(tdf_file.path)
+        if spans is None:
+            spans = self._tdf_spans[tdf_file.path] = list(self._iter_cluster_spans(tdf_file.content))
+        return spans
 
-        units = []
-        if 'unit' in tdf.get('tutor', {}):
-            units.extend(tdf['tutor']['unit'])
-        if 'unitTemplate' in tdf.get('tutor', {}):
-            units.extend(tdf['tutor']['unitTemplate'])
+    def _iter_cluster_spans(self, tdf: Dict) -> Iterator[Tuple[int, int]]:
+        """Yield (lo, hi) cluster-index spans referenced by a TDF's units.
+
+        Ranges like '3-5' stay as a single span instead of being expanded,
+        so bounds checks cost O(#spans) rather than O(#indices).
+        """
+        tutor = tdf.get('tutor') or {}
+        units = list(tutor.get('unit', ())) + list(tutor.get('unitTemplate', ()))
 
         for unit in units:
-            if 'clusterIndex' in unit:
+            cluster_index = unit.get('clusterIndex')
+            if cluster_index is not None:
                 try:
-                    indices.add(int(unit['clusterIndex']))
+                    idx = int(cluster_index)
                 except (ValueError, TypeError):
                     pass
+                else:
+                    yield idx, idx
+
+            assess_session = unit.get('assessmentsession')
+            clusterlist = assess_session.get('clusterlist') if isinstance(assess_session, dict) else None
+            if isinstance(clusterlist, str):
+                # One finditer pass; no per-part splits or exception handling
+                for m in _SPAN_RE.finditer(clusterlist):
+                    lo = int(m[1])
+                    hi = int(m[2]) if m[2] else lo
+                    if lo <= hi:
+                        yield lo, hi
 
-            if 'assessmentsession' in unit and 'clusterlist' in unit['assessmentsession']:
-                clusterlist = unit['assessmentsession']['clusterlist']
-                if isinstance(clusterlist, str):
-                    parts = clusterlist.split(',')
-                    for part in parts:
-                        part = part.strip()
-                        if '-' in part:
-                            try:
-                                start, end = map(int, part.split('-'))
-                                for i in range(start, end + 1):
-                                    indices.add(i)
-                            except (ValueError, TypeError):
-                                pass
-                        else:
-                            try:
-                                indices.add(int(part))
-                            except (ValueError, TypeError):
-                                pass
-
+    def _extract_cluster_indices_from_tdf(self, tdf: Dict) -> List[int]:
+        """Extract cluster indices referenced in TDF."""
+        indices = set()
+        for lo, hi in self._iter_cluster_spans(tdf):
+            indices.update(range(lo, hi + 1))
         return list(indices)
 
-    def _validate_video_session_questions(self, tdf_file: Dict, stim_file: Dict) -> bool:
+    def _validate_video_session_questions(self, tdf_file: FileMeta, stim_file: FileMeta) -> bool:
         """Validate video session questions exist in stimulus file and have proper structure."""
-        tdf_content = tdf_file['content']
-        stim_content = stim_file['content']
-        tdf_name = tdf_file['name']
+        tdf_content = tdf_file.content
+        stim_content = stim_file.content
+        tdf_name = tdf_file.name
         valid = True
+        clusters = stim_content['setspec']['clusters']
+        num_clusters = len(clusters)
 
         # Check all units for video sessions
-        units = []
-        if 'unit' in tdf_content.get('tutor', {}):
-            unit_data = tdf_content['tutor']['unit']
-            if isinstance(unit_data, list):
-                units = unit_data
-            else:
-                units = [unit_data]
+        units = _iter_units(tdf_content)
 
         for unit_idx, unit in enumerate(units):
-            if 'videosession' not in unit:
+            videosession = unit.get('videosession')
+            if videosession is None:
                 continue
 
-            videosession = unit['videosession']
-            
             # Check if questions field exists
-            if 'questions' not in videosession:
+            questions = videosession.get('questions')
+            if questions is None:
                 self.add_warning(f"TDF '{tdf_name}' unit {unit_idx} has videosession but no 'questions' array")
                 continue
 
-            questions = videosession['questions']
-            
             # Validate questions is an array
             if not isinstance(questions, list):
                 self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: videosession.questions must be an array, got {type(questions).__name__}")
@@ -595,8 +1298,8 @@ class PackageValidator:
                 continue
 
             # Validate questiontimes if present
-            if 'questiontimes' in videosession:
-                question_times = videosession['questiontimes']
+            question_times = videosession.get('questiontimes')
+            if question_times is not None:
                 if not isinstance(question_times, list):
                     self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: videosession.questiontimes must be an array")
                     valid = False
@@ -604,8 +1307,6 @@ class PackageValidator:
                     self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: videosession.questiontimes length ({len(question_times)}) doesn't match questions length ({len(questions)})")
                     valid = False
 
-            num_clusters = len(stim_content['setspec']['clusters'])
-            
             # Validate each question cluster exists
             for q_idx, cluster_id in enumerate(questions):
                 if not isinstance(cluster_id, int):
@@ -616,35 +1317,36 @@ class PackageValidator:
                 if cluster_id < 0 or cluster_id >= num_clusters:
                     error_msg = f"TDF '{tdf_name}' unit {unit_idx}: question cluster {cluster_id} does not exist in stimulus file (has {num_clusters} clusters: 0-{num_clusters-1})"
                     self.add_error(error_msg)
-                    print(f"  ⚠️  Video Question Issue: {error_msg}")
+                    if self.verbose:
+                        print(f"  ⚠️  Video Question Issue: {error_msg}")
                     valid = False
                     continue
 
                 # Validate the cluster structure for video questions
-                cluster = stim_content['setspec']['clusters'][cluster_id]
-                if not self._validate_video_question_cluster(cluster, cluster_id, tdf_name, unit_idx):
+                if not self._validate_video_question_cluster(clusters[cluster_id], cluster_id, tdf_name, unit_idx):
                     valid = False
 
             # Validate checkpoint behavior
-            if 'checkpointBehavior' in videosession:
-                behavior = videosession['checkpointBehavior']
-                valid_behaviors = ['none', 'all', 'some', 'adaptive']
-                if behavior not in valid_behaviors:
-                    self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: invalid checkpointBehavior '{behavior}', must be one of {valid_behaviors}")
+            behavior = videosession.get('checkpointBehavior')
+            if behavior is not None:
+                if behavior not in _VALID_BEHAVIORS:
+                    self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: invalid checkpointBehavior '{behavior}', must be one of ['none', 'all', 'some', 'adaptive']")
                     valid = False
 
                 # Validate adaptive checkpoints
                 if behavior == 'adaptive':
-                    if 'checkpoints' not in videosession:
+                    checkpoints = videosession.get('checkpoints')
+                    if checkpoints is None:
                         self.add_warning(f"TDF '{tdf_name}' unit {unit_idx}: checkpointBehavior is 'adaptive' but no 'checkpoints' array defined")
-                    elif not isinstance(videosession['checkpoints'], list):
+                    elif not isinstance(checkpoints, list):
                         self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: videosession.checkpoints must be an array")
                         valid = False
 
                 # Validate 'some' checkpoint behavior
                 if behavior == 'some':
-                    if 'checkpointQuestions' in videosession:
-                        if not isinstance(videosession['checkpointQuestions'], list):
+                    checkpoint_questions = videosession.get('checkpointQuestions')
+                    if checkpoint_questions is not None:
+                        if not isinstance(checkpoint_questions, list):
                             self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: videosession.checkpointQuestions must be an array")
                             valid = False
                     else:
@@ -652,8 +1354,7 @@ class PackageValidator:
                         has_checkpoint_prop = False
                         for cluster_id in questions:
                             if cluster_id < num_clusters:
-                                cluster = stim_content['setspec']['clusters'][cluster_id]
-                                for stim in cluster.get('stims', []):
+                                for stim in clusters[cluster_id].get('stims', []):
                                     if 'checkpoint' in stim:
                                         has_checkpoint_prop = True
                                         break
@@ -666,246 +1367,171 @@ class PackageValidator:
         """Validate a cluster intended for video questions has appropriate structure."""
         valid = True
 
-        if 'stims' not in cluster or not cluster['stims']:
+        stims = cluster.get('stims')
+        if not stims:
             self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: video question cluster {cluster_id} has no stims")
             return False
 
         has_multiple_choice = False
         has_text_response = False
 
-        for stim_idx, stim in enumerate(cluster['stims']):
+        for stim_idx, stim in enumerate(stims):
             # Check if it's a multiple-choice question
-            if 'response' in stim:
-                response = stim['response']
-                if isinstance(response, dict):
-                    response_type = response.get('type', 'text')
-                    
-                    # For video questions, multiple choice is recommended
-                    if response_type in ['selectone', 'selectmultiple']:
-                        has_multiple_choice = True
-                        # Validate options exist
-                        if 'options' not in response:
-                            self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: video question cluster {cluster_id}, stim {stim_idx} has type '{response_type}' but no options array")
-                            valid = False
-                        elif not isinstance(response['options'], list) or len(response['options']) < 2:
-                            self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: video question cluster {cluster_id}, stim {stim_idx} needs at least 2 options for type '{response_type}'")
-                            valid = False
-                    elif response_type == 'text' or 'correctResponse' in response:
-                        # This is a text-based response (like flashcards)
-                        has_text_response = True
+            response = stim.get('response')
+            if isinstance(response, dict):
+                response_type = response.get('type', 'text')
+
+                # For video questions, multiple choice is recommended
+                if response_type in ['selectone', 'selectmultiple']:
+                    has_multiple_choice = True
+                    # Validate options exist
+                    options = response.get('options')
+                    if options is None:
+                        self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: video question cluster {cluster_id}, stim {stim_idx} has type '{response_type}' but no options array")
+                        valid = False
+                    elif not isinstance(options, list) or len(options) < 2:
+                        self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: video question cluster {cluster_id}, stim {stim_idx} needs at least 2 options for type '{response_type}'")
+                        valid = False
+                elif response_type == 'text' or 'correctResponse' in response:
+                    # This is a text-based response (like flashcards)
+                    has_text_response = True
 
         # No warnings - timeline report will show response types
 
         return valid
 
-    def _validate_learning_session_clusterlist(self, tdf_file: Dict, stim_file: Dict) -> bool:
+    def _validate_learning_session_clusterlist(self, tdf_file: FileMeta, stim_file: FileMeta) -> bool:
         """Validate learning session clusterlist format and references."""
-        tdf_content = tdf_file['content']
-        stim_content = stim_file['content']
-        tdf_name = tdf_file['name']
-        valid = True
-
-        units = []
-        if 'unit' in tdf_content.get('tutor', {}):
-            unit_data = tdf_content['tutor']['unit']
-            if isinstance(unit_data, list):
-                units = unit_data
-            else:
-                units = [unit_data]
-
-        for unit_idx, unit in enumerate(units):
-            if 'learningsession' not in unit:
-                continue
+        return self._validate_session_clusterlist(
+            tdf_file, stim_file, 'learningsession', 'Learning Session', 'clusterlist')
 
-            learningsession = unit['learningsession']
-            
-            if 'clusterlist' not in learningsession:
-                self.add_warning(f"TDF '{tdf_name}' unit {unit_idx} has learningsession but no 'clusterlist'")
-                continue
-
-            clusterlist = learningsession['clusterlist']
-            
-            # Must be a string
-            if not isinstance(clusterlist, str):
-                self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: learningsession.clusterlist must be a string, got {type(clusterlist).__name__}")
-                valid = False
-                continue
-
-            # Validate format (space-separated, ranges allowed like "0-60")
-            if not self._validate_clusterlist_format(clusterlist):
-                self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: learningsession.clusterlist has invalid format: '{clusterlist}'")
-                valid = False
-                continue
-
-            # Validate cluster indices exist
-            cluster_indices = self._extract_cluster_indices_from_clusterlist(clusterlist)
-            num_clusters = len(stim_content['setspec']['clusters'])
-            
-            for idx in cluster_indices:
-                if idx < 0 or idx >= num_clusters:
-                    error_msg = f"TDF '{tdf_name}' unit {unit_idx}: clusterlist references cluster {idx} which doesn't exist (valid range: 0-{num_clusters-1})"
-                    self.add_error(error_msg)
-                    print(f"  ⚠️  Learning Session Issue: {error_msg}")
-                    valid = False
-
-        return valid
-
-    def _extract_cluster_indices_from_clusterlist(self, clusterlist: str) -> List[int]:
-        """Extract cluster indices from space-separated clusterlist string (supports ranges like '0-60')."""
-        indices = set()
-        parts = clusterlist.strip().split()
-        
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-                
-            if '-' in part:
-                # Handle range like "0-60"
-                try:
-                    start, end = part.split('-', 1)
-                    start_idx = int(start)
-                    end_idx = int(end)
-                    for i in range(start_idx, end_idx + 1):
-                        indices.add(i)
-                except (ValueError, TypeError):
-                    pass
-            else:
-                # Single number
-                try:
-                    indices.add(int(part))
-                except (ValueError, TypeError):
-                    pass
-
-        return sorted(list(indices))
-
-    def _validate_assessment_session_clusterlist(self, tdf_file: Dict, stim_file: Dict) -> bool:
+    def _validate_assessment_session_clusterlist(self, tdf_file: FileMeta, stim_file: FileMeta) -> bool:
         """Validate assessment session clusterlist format and references."""
-        tdf_content = tdf_file['content']
-        stim_content = stim_file['content']
-        tdf_name = tdf_file['name']
+        return self._validate_session_clusterlist(
+            tdf_file, stim_file, 'assessmentsession', 'Assessment Session',
+            'assessmentsession clusterlist')
+
+    def _validate_session_clusterlist(self, tdf_file: FileMeta, stim_file: FileMeta,
+                                      session_key: str, label: str, ref_label: str) -> bool:
+        """Shared clusterlist validation for learning and assessment sessions.
+
+        The two session types differ only in the unit key and diagnostic
+        wording, so they share this body rather than duplicating it.
+        """
+        tdf_content = tdf_file.content
+        stim_content = stim_file.content
+        tdf_name = tdf_file.name
         valid = True
+        num_clusters = len(stim_content['setspec']['clusters'])
 
-        units = []
-        if 'unit' in tdf_content.get('tutor', {}):
-            unit_data = tdf_content['tutor']['unit']
-            if isinstance(unit_data, list):
-                units = unit_data
-            else:
-                units = [unit_data]
+        units = _iter_units(tdf_content)
 
         for unit_idx, unit in enumerate(units):
-            if 'assessmentsession' not in unit:
+            session = unit.get(session_key)
+            if session is None:
                 continue
 
-            assessmentsession = unit['assessmentsession']
-            
-            if 'clusterlist' not in assessmentsession:
-                self.add_warning(f"TDF '{tdf_name}' unit {unit_idx} has assessmentsession but no 'clusterlist'")
+            clusterlist = session.get('clusterlist')
+            if clusterlist is None:
+                self.add_warning(f"TDF '{tdf_name}' unit {unit_idx} has {session_key} but no 'clusterlist'")
                 continue
 
-            clusterlist = assessmentsession['clusterlist']
-            
             # Must be a string
             if not isinstance(clusterlist, str):
-                self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: assessmentsession.clusterlist must be a string, got {type(clusterlist).__name__}")
+                self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: {session_key}.clusterlist must be a string, got {type(clusterlist).__name__}")
                 valid = False
                 continue
 
-            # Validate format
-            if not self._validate_clusterlist_format(clusterlist):
-                self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: assessmentsession.clusterlist has invalid format: '{clusterlist}'")
+            # Validate format and extract indices in one cached step
+            ok, cluster_indices = _parse_clusterlist(clusterlist)
+            if not ok:
+                self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: {session_key}.clusterlist has invalid format: '{clusterlist}'")
                 valid = False
                 continue
 
-            # Validate cluster indices exist
-            cluster_indices = self._extract_cluster_indices_from_clusterlist(clusterlist)
-            num_clusters = len(stim_content['setspec']['clusters'])
-            
-            for idx in cluster_indices:
-                if idx < 0 or idx >= num_clusters:
-                    error_msg = f"TDF '{tdf_name}' unit {unit_idx}: assessmentsession clusterlist references cluster {idx} which doesn't exist (valid range: 0-{num_clusters-1})"
-                    self.add_error(error_msg)
-                    print(f"  ⚠️  Assessment Session Issue: {error_msg}")
-                    valid = False
+            # Indices come back sorted, so two endpoint compares clear the
+            # whole list; only walk it when something is out of range.
+            if cluster_indices and (cluster_indices[0] < 0
+                                    or cluster_indices[-1] >= num_clusters):
+                for idx in cluster_indices:
+                    if idx < 0 or idx >= num_clusters:
+                        error_msg = f"TDF '{tdf_name}' unit {unit_idx}: {ref_label} references cluster {idx} which doesn't exist (valid range: 0-{num_clusters-1})"
+                        self.add_error(error_msg)
+                        if self.verbose:
+                            print(f"  ⚠️  {label} Issue: {error_msg}")
+                        valid = False
 
         return valid
 
-    def _validate_adaptive_logic(self, tdf_file: Dict, stim_file: Dict) -> bool:
+    def _extract_cluster_indices_from_clusterlist(self, clusterlist: str) -> Tuple[int, ...]:
+        """Extract cluster indices from space-separated clusterlist string (supports ranges like '0-60')."""
+        return _parse_clusterlist_indices(clusterlist)
+
+    def _validate_adaptive_logic(self, tdf_file: FileMeta, stim_file: FileMeta) -> bool:
         """Validate adaptive logic syntax and cluster references."""
-        tdf_content = tdf_file['content']
-        stim_content = stim_file['content']
-        tdf_name = tdf_file['name']
+        tdf_content = tdf_file.content
+        stim_content = stim_file.content
+        tdf_name = tdf_file.name
         valid = True
 
-        units = []
-        if 'unit' in tdf_content.get('tutor', {}):
-            unit_data = tdf_content['tutor']['unit']
-            if isinstance(unit_data, list):
-                units = unit_data
-            else:
-                units = [unit_data]
+        # Hoisted once per TDF: every cluster reference in every rule needs
+        # these, and the chained subscripts are not free inside the loop.
+        clusters = stim_content['setspec']['clusters']
+        num_clusters = len(clusters)
+        stims_per_cluster = [len(c.get('stims', ())) for c in clusters]
+
+        units = _iter_units(tdf_content)
 
         for unit_idx, unit in enumerate(units):
-            if 'adaptive' not in unit:
+            adaptive_logic = unit.get('adaptive')
+            if adaptive_logic is None:
                 continue
-
-            adaptive_logic = unit['adaptive']
             
             if not isinstance(adaptive_logic, list):
                 self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: 'adaptive' must be an array of logic strings")
                 valid = False
                 continue
 
-            num_clusters = len(stim_content['setspec']['clusters'])
-
             for logic_idx, logic_string in enumerate(adaptive_logic):
                 if not isinstance(logic_string, str):
                     self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: adaptive[{logic_idx}] must be a string")
                     valid = False
                     continue
 
-                # Basic syntax validation
-                if not logic_string.startswith('IF'):
-                    self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: adaptive[{logic_idx}] must start with 'IF': '{logic_string}'")
-                    valid = False
-                    continue
+                # Basic syntax validation: one regex scan on the hot
+                # path; only unusual rules fall through to the substring
+                # checks so the right error can be attributed.
+                if _ADAPTIVE_RULE_RE.match(logic_string) is None:
+                    if not logic_string.startswith('IF'):
+                        self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: adaptive[{logic_idx}] must start with 'IF': '{logic_string}'")
+                        valid = False
+                        continue
+                    if 'THEN' not in logic_string:
+                        self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: adaptive[{logic_idx}] must contain 'THEN': '{logic_string}'")
+                        valid = False
+                        continue
 
-                if 'THEN' not in logic_string:
-                    self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: adaptive[{logic_idx}] must contain 'THEN': '{logic_string}'")
-                    valid = False
-                    continue
+                # Extract cluster references (format: C<cluster>S<stim>)
+                # from the action part after THEN
+                _, _, cluster_refs = _parse_adaptive_rule(logic_string)
 
-                # Extract action part (after THEN)
-                parts = logic_string.split('THEN')
-                if len(parts) < 2:
-                    continue
-                    
-                action = parts[1].strip()
-                
-                # Extract cluster references from action (format: C<cluster>S<stim>)
-                import re
-                cluster_refs = re.findall(r'C(\d+)S(\d+)', action)
-                
-                for cluster_str, stim_str in cluster_refs:
-                    cluster_id = int(cluster_str)
-                    stim_id = int(stim_str)
-                    
+                for cluster_id, stim_id in cluster_refs:
                     # Validate cluster exists
                     if cluster_id < 0 or cluster_id >= num_clusters:
                         error_msg = f"TDF '{tdf_name}' unit {unit_idx}: adaptive[{logic_idx}] references non-existent cluster C{cluster_id} (valid: 0-{num_clusters-1})"
                         self.add_error(error_msg)
-                        print(f"  ⚠️  Adaptive Logic Issue: {error_msg}")
+                        if self.verbose:
+                            print(f"  ⚠️  Adaptive Logic Issue: {error_msg}")
                         valid = False
                         continue
                     
                     # Validate stim exists in cluster
-                    cluster = stim_content['setspec']['clusters'][cluster_id]
-                    num_stims = len(cluster.get('stims', []))
+                    num_stims = stims_per_cluster[cluster_id]
                     if stim_id < 0 or stim_id >= num_stims:
                         error_msg = f"TDF '{tdf_name}' unit {unit_idx}: adaptive[{logic_idx}] references C{cluster_id}S{stim_id} but cluster {cluster_id} only has {num_stims} stims (0-{num_stims-1})"
                         self.add_error(error_msg)
-                        print(f"  ⚠️  Adaptive Logic Issue: {error_msg}")
+                        if self.verbose:
+                            print(f"  ⚠️  Adaptive Logic Issue: {error_msg}")
                         valid = False
 
                 # Check for CHECKPOINT keyword with AT time specification
@@ -914,10 +1540,10 @@ class PackageValidator:
 
         return valid
 
-    def _check_architectural_issues(self, tdf_file: Dict, stim_file: Dict):
+    def _check_architectural_issues(self, tdf_file: FileMeta, stim_file: FileMeta):
         """Check for architectural mismatches between stimulus structure and MoFaCTS expectations."""
-        stim_content = stim_file['content']
-        stim_name = stim_file['name']
+        stim_content = stim_file.content
+        stim_name = stim_file.name
         
         clusters = stim_content['setspec']['clusters']
         
@@ -928,9 +1554,9 @@ class PackageValidator:
             
             for stim_idx, stim in enumerate(stims):
                 # Check for nested incorrectResponses that should be at root level
-                if 'response' in stim and isinstance(stim['response'], dict):
-                    response_obj = stim['response']
-                    if 'incorrectResponses' in response_obj and response_obj['incorrectResponses']:
+                response_obj = stim.get('response')
+                if isinstance(response_obj, dict):
+                    if response_obj.get('incorrectResponses'):
                         # Check if it's also at root (which would be correct)
                         if 'incorrectResponses' not in stim:
                             warning_msg = (
@@ -939,128 +1565,135 @@ class PackageValidator:
                                 f"MoFaCTS expects it at stim root level. Multiple-choice will display as text input!"
                             )
                             self.add_warning(warning_msg)
-                            print(f"  ⚠️  Architectural Issue: {warning_msg}")
+                            if self.verbose:
+                                print(f"  ⚠️  Architectural Issue: {warning_msg}")
 
     def validate_media_references(self) -> bool:
         """Validate media file references in stimulus files."""
         valid = True
-        media_names = {f['name'] for f in self.media_files}
+        media_names = {f.name for f in self.media_files}
+        add_error = self.add_error
 
         for stim_file in self.stim_files:
-            for cluster_idx, cluster in enumerate(stim_file['content']['setspec']['clusters']):
+            file_name = stim_file.name
+            for cluster_idx, cluster in enumerate(stim_file.content['setspec']['clusters']):
                 for stim_idx, stim in enumerate(cluster['stims']):
-                    if 'display' in stim:
-                        display = stim['display']
-                        media_fields = ['audioSrc', 'imgSrc', 'videoSrc']
-
-                        for field in media_fields:
-                            if field in display:
-                                src = display[field]
-                                # Check if it's a URL or local file
-                                if not src.startswith('http') and src not in media_names:
-                                    self.add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{stim_file['name']}' references {field} '{src}' which was not found in package")
-                                    valid = False
+                    display = stim.get('display')
+                    if not display:
+                        continue
+                    for field, src in display.items():
+                        # Skip non-media fields, external URLs, and packaged files
+                        if (field in _MEDIA_FIELDS and isinstance(src, str)
+                                and not src.startswith(_URL_PREFIXES)
+                                and src not in media_names):
+                            add_error(f"Stim {stim_idx} in cluster {cluster_idx} of '{file_name}' references {field} '{src}' which was not found in package")
+                            valid = False
 
         return valid
 
+    def _all_tdf_units(self) -> List[Tuple[FileMeta, int, Dict]]:
+        """Return the flattened unit walk over every TDF, built once."""
+        if self._tdf_units is None:
+            self._tdf_units = [
+                (tdf_file, unit_idx, unit)
+                for tdf_file in self.tdf_files
+                for unit_idx, unit in enumerate(_iter_units(tdf_file.content))
+            ]
+        return self._tdf_units
+
     def validate_session_consistency(self) -> bool:
         """Validate consistency between session types and their requirements."""
         valid = True
 
-        for tdf_file in self.tdf_files:
-            tdf_content = tdf_file['content']
-            tdf_name = tdf_file['name']
-
-            units = []
-            if 'unit' in tdf_content.get('tutor', {}):
-                unit_data = tdf_content['tutor']['unit']
-                if isinstance(unit_data, list):
-                    units = unit_data
-                else:
-                    units = [unit_data]
-
-            for unit_idx, unit in enumerate(units):
-                session_types = []
-                
-                if 'videosession' in unit:
-                    session_types.append('videosession')
-                if 'learningsession' in unit:
-                    session_types.append('learningsession')
-                if 'assessmentsession' in unit:
-                    session_types.append('assessmentsession')
-
-                # Warn if multiple session types in one unit
-                if len(session_types) > 1:
-                    self.add_warning(f"TDF '{tdf_name}' unit {unit_idx} has multiple session types: {', '.join(session_types)}")
-
-                # Check for video session requirements
-                if 'videosession' in unit:
-                    videosession = unit['videosession']
-                    
-                    if 'videosource' not in videosession:
-                        self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: videosession missing required 'videosource'")
-                        valid = False
-                    
-                    if 'questions' not in videosession:
-                        self.add_warning(f"TDF '{tdf_name}' unit {unit_idx}: videosession has no 'questions' array")
-                    elif 'questiontimes' not in videosession:
-                        self.add_warning(f"TDF '{tdf_name}' unit {unit_idx}: videosession has 'questions' but no 'questiontimes'")
+        for tdf_file, unit_idx, unit in self._all_tdf_units():
+            tdf_name = tdf_file.name
+            videosession = unit.get('videosession')
+            learningsession = unit.get('learningsession')
+            assessmentsession = unit.get('assessmentsession')
+
+            session_types = []
+            if videosession is not None:
+                session_types.append('videosession')
+            if learningsession is not None:
+                session_types.append('learningsession')
+            if assessmentsession is not None:
+                session_types.append('assessmentsession')
+
+            # Warn if multiple session types in one unit
+            if len(session_types) > 1:
+                self.add_warning(f"TDF '{tdf_name}' unit {unit_idx} has multiple session types: {', '.join(session_types)}")
+
+            # Check for video session requirements
+            if videosession is not None:
+                if 'videosource' not in videosession:
+                    self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: videosession missing required 'videosource'")
+                    valid = False
                     
-                    # Check for preventScrubbing without appropriate checkpoint settings
-                    if videosession.get('preventScrubbing') and not videosession.get('checkpointBehavior'):
-                        self.add_warning(f"TDF '{tdf_name}' unit {unit_idx}: preventScrubbing is true but checkpointBehavior is not set")
-
-                # Check for learning session requirements
-                if 'learningsession' in unit:
-                    learningsession = unit['learningsession']
+                if 'questions' not in videosession:
+                    self.add_warning(f"TDF '{tdf_name}' unit {unit_idx}: videosession has no 'questions' array")
+                elif 'questiontimes' not in videosession:
+                    self.add_warning(f"TDF '{tdf_name}' unit {unit_idx}: videosession has 'questions' but no 'questiontimes'")
                     
-                    if 'clusterlist' not in learningsession:
-                        self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: learningsession missing required 'clusterlist'")
-                        valid = False
+                # Check for preventScrubbing without appropriate checkpoint settings
+                if videosession.get('preventScrubbing') and not videosession.get('checkpointBehavior'):
+                    self.add_warning(f"TDF '{tdf_name}' unit {unit_idx}: preventScrubbing is true but checkpointBehavior is not set")
+
+            # Check for learning session requirements
+            if learningsession is not None:
+                if 'clusterlist' not in learningsession:
+                    self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: learningsession missing required 'clusterlist'")
+                    valid = False
 
-                # Check for assessment session requirements
-                if 'assessmentsession' in unit:
-                    assessmentsession = unit['assessmentsession']
-                    
-                    if 'clusterlist' not in assessmentsession:
-                        self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: assessmentsession missing required 'clusterlist'")
-                        valid = False
+            # Check for assessment session requirements
+            if assessmentsession is not None:
+                if 'clusterlist' not in assessmentsession:
+                    self.add_error(f"TDF '{tdf_name}' unit {unit_idx}: assessmentsession missing required 'clusterlist'")
+                    valid = False
 
         return valid
 
-    def generate_unit_timelines(self) -> Dict[str, List[Dict]]:
-        """Generate execution timelines for all units in all TDF files."""
-        timelines = {}
-        
+    def iter_unit_timelines(self) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """Yield (tdf_name, unit_timeline) pairs one unit at a time.
+
+        The report writer consumes this lazily so only one unit's
+        timeline is live at a time instead of every unit in every TDF.
+        Each TDF is announced with a (tdf_name, None) marker before its
+        units so unit-less TDFs (e.g. a root TDF) still appear.
+        """
         for tdf_file in self.tdf_files:
-            tdf_content = tdf_file['content']
-            tdf_name = tdf_file['name']
+            tdf_content = tdf_file.content
+            tdf_name = tdf_file.name
+            yield tdf_name, None
             
             # Find the corresponding stimulus file
-            stim_file_name = self._get_stimulus_file_from_tdf(tdf_content)
+            stim_file_name = self._tdf_stim_name.get(tdf_file.path)
             stim_file = None
             if stim_file_name:
-                stim_file = next((f for f in self.stim_files if f['name'] == stim_file_name), None)
-            
-            units = []
-            if 'unit' in tdf_content.get('tutor', {}):
-                unit_data = tdf_content['tutor']['unit']
-                if isinstance(unit_data, list):
-                    units = unit_data
-                else:
-                    units = [unit_data]
+                stim_file = self._stim_by_name.get(stim_file_name)
             
-            tdf_timeline = []
+            units = _iter_units(tdf_content)
             
             for unit_idx, unit in enumerate(units):
-                unit_timeline = self._generate_unit_timeline(unit, unit_idx, stim_file, tdf_name)
-                tdf_timeline.append(unit_timeline)
-            
-            timelines[tdf_name] = tdf_timeline
-        
+                yield tdf_name, self._generate_unit_timeline(unit, unit_idx, stim_file, tdf_name)
+
+    def generate_unit_timelines(self) -> Dict[str, List[Dict]]:
+        """Generate execution timelines for all units in all TDF files.
+
+        Events are serialized back to plain dicts via
+        TimelineEvent.to_dict() so the result stays JSON-compatible; the
+        report writer uses iter_unit_timelines directly and keeps the
+        slotted objects.
+        """
+        timelines: Dict[str, List[Dict]] = {}
+        for tdf_name, unit_timeline in self.iter_unit_timelines():
+            if unit_timeline is None:
+                timelines.setdefault(tdf_name, [])
+            else:
+                unit_timeline['events'] = [event.to_dict() for event in unit_timeline['events']]
+                timelines[tdf_name].append(unit_timeline)
         return timelines
 
-    def _generate_unit_timeline(self, unit: Dict, unit_idx: int, stim_file: Optional[Dict], tdf_name: str) -> Dict:
+    def _generate_unit_timeline(self, unit: Dict, unit_idx: int, stim_file: Optional[FileMeta], tdf_name: str) -> Dict:
         """Generate timeline for a single unit."""
         timeline = {
             'unit_index': unit_idx,
@@ -1083,14 +1716,14 @@ class PackageValidator:
             # Instruction-only unit
             timeline['session_type'] = 'instruction'
             if 'unitinstructions' in unit:
-                timeline['events'].append({
-                    'type': 'instruction',
-                    'description': 'Display unit instructions',
-                    'details': {
+                timeline['events'].append(TimelineEvent(
+                    type='instruction',
+                    description='Display unit instructions',
+                    details={
                         'has_instructions': True,
                         'has_timer': 'timer' in unit
                     }
-                })
+                ))
         
         # Check for lockout
         if 'deliveryparams' in unit:
@@ -1098,32 +1731,24 @@ class PackageValidator:
             if isinstance(dp, list) and len(dp) > 0:
                 dp = dp[0]
             if isinstance(dp, dict) and 'lockoutminutes' in dp:
-                timeline['events'].insert(0, {
-                    'type': 'lockout',
-                    'description': f"Lockout period: {dp['lockoutminutes']} minutes",
-                    'details': {'duration_minutes': dp['lockoutminutes']}
-                })
+                timeline['events'].insert(0, TimelineEvent(
+                    type='lockout',
+                    description=f"Lockout period: {dp['lockoutminutes']} minutes",
+                    details={'duration_minutes': dp['lockoutminutes']}
+                ))
         
         # Adaptive logic diagram (unit-level 'adaptive' rules)
         if 'adaptive' in unit and isinstance(unit['adaptive'], list) and unit['adaptive']:
             adaptive_rules = unit['adaptive']
             parsed_rules = []
-            import re
             for idx, rule in enumerate(adaptive_rules, 1):
-                if not isinstance(rule, str) or 'THEN' not in rule:
+                condition = action = None
+                if isinstance(rule, str):
+                    condition, action, refs = _parse_adaptive_rule(rule)
+                if condition is None:
                     parsed_rules.append({'index': idx, 'raw': rule, 'condition': None, 'actions': [], 'warning': 'Malformed rule (missing THEN or not a string)'});
                     continue
-                parts = rule.split('THEN', 1)
-                condition = parts[0].strip()
-                action = parts[1].strip()
-                refs = re.findall(r'C(\d+)S(\d+)', action)
-                actions = []
-                for c_str, s_str in refs:
-                    try:
-                        c_id = int(c_str); s_id = int(s_str)
-                        actions.append({'cluster': c_id, 'stim': s_id})
-                    except ValueError:
-                        pass
+                actions = [{'cluster': c_id, 'stim': s_id} for c_id, s_id in refs]
                 parsed_rules.append({'index': idx, 'raw': rule, 'condition': condition, 'actions': actions})
 
             # Build ASCII diagram lines
@@ -1141,158 +1766,173 @@ class PackageValidator:
                 else:
                     diagram_lines.append("  └─ (no cluster actions parsed)")
 
-            timeline['events'].append({
-                'type': 'adaptive_logic_diagram',
-                'description': 'Adaptive branching diagram',
-                'details': {
+            timeline['events'].append(TimelineEvent(
+                type='adaptive_logic_diagram',
+                description='Adaptive branching diagram',
+                details={
                     'logic_rule_count': len(parsed_rules),
                     'diagram_lines': diagram_lines,
                     'raw_rules': adaptive_rules
                 }
-            })
+            ))
         
         return timeline
 
-    def _add_video_timeline_events(self, unit: Dict, timeline: Dict, stim_file: Optional[Dict], tdf_name: str):
+    def _add_video_timeline_events(self, unit: Dict, timeline: Dict, stim_file: Optional[FileMeta], tdf_name: str):
         """Add timeline events for video session."""
         videosession = unit['videosession']
+        events_append = timeline['events'].append
         
-        timeline['events'].append({
-            'type': 'video_start',
-            'description': 'Video playback begins',
-            'details': {
+        events_append(TimelineEvent(
+            type='video_start',
+            description='Video playback begins',
+            details={
                 'video_source': videosession.get('videosource', 'N/A'),
                 'prevent_scrubbing': videosession.get('preventScrubbing', False),
                 'checkpoint_behavior': videosession.get('checkpointBehavior', 'none'),
                 'rewind_on_incorrect': videosession.get('rewindOnIncorrect', False)
             }
-        })
+        ))
         
         questions = videosession.get('questions', [])
         question_times = videosession.get('questiontimes', [])
+        num_times = len(question_times)
+        total_questions = len(questions)
         
         # Pair questions with times
         for idx, cluster_id in enumerate(questions):
-            time = question_times[idx] if idx < len(question_times) else None
+            time = question_times[idx] if idx < num_times else None
             
             # Get question details from stim file
             question_details = self._get_question_details(cluster_id, stim_file)
             
-            timeline['events'].append({
-                'type': 'video_question',
-                'time_seconds': time,
-                'description': f"Video pauses for question at {time}s" if time else "Video pauses for question",
-                'details': {
+            events_append(TimelineEvent(
+                type='video_question',
+                time_seconds=time,
+                description=f"Video pauses for question at {time}s" if time else "Video pauses for question",
+                details={
                     'cluster_index': cluster_id,
                     'question_number': idx + 1,
-                    'total_questions': len(questions),
+                    'total_questions': total_questions,
                     **question_details
                 }
-            })
+            ))
         
         # Check for adaptive logic
         if 'adaptiveLogic' in videosession:
-            timeline['events'].append({
-                'type': 'adaptive_processing',
-                'description': 'Adaptive logic may add additional questions dynamically',
-                'details': {
+            events_append(TimelineEvent(
+                type='adaptive_processing',
+                description='Adaptive logic may add additional questions dynamically',
+                details={
                     'logic_count': len(videosession['adaptiveLogic']),
                     'logic_rules': videosession['adaptiveLogic']
                 }
-            })
+            ))
         
-        timeline['events'].append({
-            'type': 'video_end',
-            'description': 'Video playback completes',
-            'details': {}
-        })
+        events_append(TimelineEvent(
+            type='video_end',
+            description='Video playback completes',
+            details={}
+        ))
 
-    def _add_learning_timeline_events(self, unit: Dict, timeline: Dict, stim_file: Optional[Dict], tdf_name: str):
+    def _add_learning_timeline_events(self, unit: Dict, timeline: Dict, stim_file: Optional[FileMeta], tdf_name: str):
         """Add timeline events for learning session."""
         learningsession = unit['learningsession']
         
         clusterlist = learningsession.get('clusterlist', '')
         cluster_indices = self._extract_cluster_indices_from_clusterlist(clusterlist)
+        events_append = timeline['events'].append
         
-        timeline['events'].append({
-            'type': 'learning_start',
-            'description': 'Learning session begins',
-            'details': {
+        events_append(TimelineEvent(
+            type='learning_start',
+            description='Learning session begins',
+            details={
                 'cluster_count': len(cluster_indices),
                 'cluster_range': clusterlist,
                 'unit_mode': learningsession.get('unitMode', 'default'),
                 'practice_time': unit.get('deliveryparams', {}).get('practiceseconds', 'N/A')
             }
-        })
+        ))
         
         # List ALL clusters as questions
         total_q = len(cluster_indices)
         for i, cluster_id in enumerate(cluster_indices):
             question_details = self._get_question_details(cluster_id, stim_file)
-            timeline['events'].append({
-                'type': 'learning_question',
-                'description': f"Question {i+1}/{total_q} (cluster {cluster_id})",
-                'details': {
+            events_append(TimelineEvent(
+                type='learning_question',
+                description=f"Question {i+1}/{total_q} (cluster {cluster_id})",
+                details={
                     'cluster_index': cluster_id,
                     'question_number': i+1,
                     'total_questions': total_q,
                     **question_details
                 }
-            })
+            ))
         
-        timeline['events'].append({
-            'type': 'learning_end',
-            'description': 'Learning session completes',
-            'details': {}
-        })
+        events_append(TimelineEvent(
+            type='learning_end',
+            description='Learning session completes',
+            details={}
+        ))
 
-    def _add_assessment_timeline_events(self, unit: Dict, timeline: Dict, stim_file: Optional[Dict], tdf_name: str):
+    def _add_assessment_timeline_events(self, unit: Dict, timeline: Dict, stim_file: Optional[FileMeta], tdf_name: str):
         """Add timeline events for assessment session."""
         assessmentsession = unit['assessmentsession']
         
         clusterlist = assessmentsession.get('clusterlist', '')
         cluster_indices = self._extract_cluster_indices_from_clusterlist(clusterlist)
+        events_append = timeline['events'].append
         
-        timeline['events'].append({
-            'type': 'assessment_start',
-            'description': 'Assessment session begins',
-            'details': {
+        events_append(TimelineEvent(
+            type='assessment_start',
+            description='Assessment session begins',
+            details={
                 'cluster_count': len(cluster_indices),
                 'cluster_range': clusterlist,
                 'randomize_groups': assessmentsession.get('randomizegroups', 'false')
             }
-        })
+        ))
         
         # List ALL clusters as questions
         total_q = len(cluster_indices)
         for i, cluster_id in enumerate(cluster_indices):
             question_details = self._get_question_details(cluster_id, stim_file)
-            timeline['events'].append({
-                'type': 'assessment_question',
-                'description': f"Question {i+1}/{total_q} (cluster {cluster_id})",
-                'details': {
+            events_append(TimelineEvent(
+                type='assessment_question',
+                description=f"Question {i+1}/{total_q} (cluster {cluster_id})",
+                details={
                     'cluster_index': cluster_id,
                     'question_number': i+1,
                     'total_questions': total_q,
                     **question_details
                 }
-            })
+            ))
         
-        timeline['events'].append({
-            'type': 'assessment_end',
-            'description': 'Assessment session completes',
-            'details': {}
-        })
-
-    def _get_question_details(self, cluster_id: int, stim_file: Optional[Dict]) -> Dict:
-        """Extract question type and answer type details from cluster."""
+        events_append(TimelineEvent(
+            type='assessment_end',
+            description='Assessment session completes',
+            details={}
+        ))
+
+    def _get_question_details(self, cluster_id: int, stim_file: Optional[FileMeta]) -> Dict:
+        """Extract question type and answer type details from cluster.
+
+        Results are cached per (stimulus file, cluster): units routinely
+        reuse the same clusters, and each extraction walks the full stim
+        structure. Callers treat the returned dict as read-only.
+        """
+        if stim_file is not None:
+            cache_key = (stim_file.path, cluster_id)
+            cached = self._question_details.get(cache_key)
+            if cached is not None:
+                return cached
+        # Media keys are only added when media is present, so media-free
+        # questions carry a smaller dict and the report has less to dump.
         details = {
             'response_type': 'unknown',
             'answer_type': 'unknown',
             'has_options': False,
             'num_options': 0,
-            'has_media': False,
-            'media_types': [],
             'warnings': []
         }
         
@@ -1301,7 +1941,7 @@ class PackageValidator:
             return details
         
         try:
-            clusters = stim_file['content']['setspec']['clusters']
+            clusters = stim_file.content['setspec']['clusters']
             if cluster_id >= len(clusters):
                 details['warnings'].append(f'⚠ Cluster {cluster_id} does not exist (max: {len(clusters)-1})')
                 return details
@@ -1313,14 +1953,22 @@ class PackageValidator:
                 details['warnings'].append(f'⚠ Cluster {cluster_id} has no stimuli')
                 return details
             
-            # Analyze first stim
+            # Analyze first stim. Probe display/response once up front:
+            # every branch below reuses these, and stims missing both
+            # skip the whole body.
             stim = stims[0]
+            if not isinstance(stim, dict):
+                return details
+            display = stim.get('display')
+            response = stim.get('response')
+            if display is None and response is None:
+                return details
             
             # Check for nested response structure issue (MoFaCTS architectural mismatch)
             # MoFaCTS expects incorrectResponses at stim root, not nested in response object
-            if 'response' in stim and isinstance(stim['response'], dict):
-                response_obj = stim['response']
-                if 'incorrectResponses' in response_obj and response_obj['incorrectResponses']:
+            if isinstance(response, dict):
+                response_obj = response
+                if response_obj.get('incorrectResponses'):
                     # This is nested - check if it's also at root (which would be correct)
                     if 'incorrectResponses' not in stim:
                         details['warnings'].append(
@@ -1330,15 +1978,12 @@ class PackageValidator:
                         )
             
             # Get question text from display
-            if 'display' in stim:
-                display = stim['display']
-                
+            if display is not None:
                 # Get question text
                 if 'text' in display:
                     question_text = display['text']
                     # Strip HTML tags for cleaner output
-                    import re
-                    question_text = re.sub('<[^<]+?>', '', question_text)
+                    question_text = _decode_entities(_strip_html(question_text))
                     # Truncate if too long
                     if len(question_text) > 200:
                         question_text = question_text[:200] + '...'
@@ -1356,69 +2001,18 @@ class PackageValidator:
                     media_types.append('video')
                     details['video_file'] = display['videoSrc']
                 
-                details['has_media'] = len(media_types) > 0
-                details['media_types'] = media_types
+                if media_types:
+                    details['has_media'] = True
+                    details['media_types'] = media_types
             
             # Check response type
-            if 'response' in stim:
-                response = stim['response']
+            if response is not None:
                 if isinstance(response, dict):
                     response_type = response.get('type', 'text')
                     details['response_type'] = response_type
                     
-                    if response_type in ['selectone', 'selectmultiple']:
-                        details['answer_type'] = 'multiple_choice'
-                        options = response.get('options', [])
-                        details['has_options'] = len(options) > 0
-                        details['num_options'] = len(options)
-                        
-                        if not options:
-                            details['warnings'].append(f'⚠ Multiple-choice question has no options')
-                        elif len(options) < 2:
-                            details['warnings'].append(f'⚠ Multiple-choice question needs at least 2 options (has {len(options)})')
-                        
-                        # Extract choice text
-                        if options:
-                            choices = []
-                            has_correct = False
-                            for opt in options:
-                                if isinstance(opt, dict):
-                                    choice_text = opt.get('text', opt.get('id', 'N/A'))
-                                    choice_id = opt.get('id', '')
-                                    is_correct = (choice_id == response.get('correctResponse'))
-                                    if is_correct:
-                                        has_correct = True
-                                    choices.append({
-                                        'id': choice_id,
-                                        'text': choice_text,
-                                        'correct': is_correct
-                                    })
-                                else:
-                                    choices.append({'text': str(opt), 'correct': False})
-                            details['choices'] = choices
-                            
-                            if not has_correct:
-                                details['warnings'].append(f'⚠ No option marked as correct answer')
-                    # Inferred multiple choice: text response with correctResponse + incorrectResponses
-                    elif 'correctResponse' in response:
-                        incorrect_list = response.get('incorrectResponses')
-                        if isinstance(incorrect_list, list) and len(incorrect_list) > 0:
-                            # Treat as multiple choice even though type says text
-                            details['answer_type'] = 'multiple_choice'
-                            details['has_options'] = True
-                            # Build choices: correct first, then incorrect
-                            choices = []
-                            correct_val = str(response['correctResponse'])
-                            choices.append({'id': 'correct', 'text': correct_val, 'correct': True})
-                            for idx, inc in enumerate(incorrect_list):
-                                choices.append({'id': f'inc{idx}', 'text': str(inc), 'correct': False})
-                            details['choices'] = choices
-                            details['num_options'] = len(choices)
-                            details['warnings'].append("⚠ Inferred multiple-choice (correctResponse + incorrectResponses) but response.type='text'")
-                        else:
-                            # Plain text input
-                            details['answer_type'] = 'text_input'
-                            details['correct_answer'] = str(response['correctResponse'])
+                    handler = _RESPONSE_HANDLERS.get(response_type, _handle_text_response)
+                    handler(response, details)
                     
                     # Get incorrect responses if present
                     if 'incorrectResponses' in response:
@@ -1429,84 +2023,143 @@ class PackageValidator:
         except (KeyError, IndexError, TypeError):
             pass
         
+        self._question_details[cache_key] = details
         return details
 
     def write_timeline_report(self, output_file: str):
         """Write timeline report to file."""
-        timelines = self.generate_unit_timelines()
-        
-        with open(output_file, 'w') as f:
-            f.write("=" * 80 + "\n")
-            f.write("MoFaCTS PACKAGE EXECUTION TIMELINE REPORT\n")
-            f.write("=" * 80 + "\n\n")
+        # Binary mode with a 256 KiB buffer: each block is encoded once
+        # and handed straight to the buffered raw stream, skipping the
+        # text layer's incremental encoder, and units are written as
+        # single joined blocks so the OS sees a few large writes.
+        # A background thread does the actual writing so formatting the
+        # next unit overlaps the previous unit's write() syscall (which
+        # releases the GIL); the bounded queue caps buffered chunks.
+        with open(output_file, 'wb', buffering=1 << 18) as f:
+            chunks: 'queue.Queue[Optional[bytes]]' = queue.Queue(maxsize=8)
+            write_error: List[BaseException] = []
+
+            def _drain():
+                # On a failed write (e.g. disk full), remember the
+                # exception and keep consuming so the producer never
+                # blocks on the bounded queue; emit re-raises it.
+                while True:
+                    chunk = chunks.get()
+                    if chunk is None:
+                        break
+                    if write_error:
+                        continue
+                    try:
+                        f.write(chunk)
+                    except BaseException as e:
+                        write_error.append(e)
+
+            def emit(chunk):
+                if write_error:
+                    raise write_error[0]
+                chunks.put(chunk)
+
+            writer = threading.Thread(target=_drain, name='timeline-writer')
+            writer.start()
+            try:
+                header = _BANNER + "\nMoFaCTS PACKAGE EXECUTION TIMELINE REPORT\n" + _BANNER + "\n\n"
+                emit(header.encode('utf-8'))
             
-            for tdf_name, tdf_timeline in timelines.items():
-                f.write(f"\n{'=' * 80}\n")
-                f.write(f"TDF: {tdf_name}\n")
-                f.write(f"{'=' * 80}\n\n")
+                # Accumulate each unit into a parts list and write it as one
+                # block: one method call per unit instead of 10+ per event.
+                # Units stream out of iter_unit_timelines as they are built,
+                # so only one timeline is held in memory at a time.
+                parts: List[str] = []
+                w = parts.append
+                for tdf_name, unit_timeline in self.iter_unit_timelines():
+                    if unit_timeline is None:
+                        emit(f"\n{_BANNER}\nTDF: {tdf_name}\n{_BANNER}\n\n".encode('utf-8'))
+                        continue
                 
-                for unit_timeline in tdf_timeline:
-                    f.write(f"  Unit {unit_timeline['unit_index']}: {unit_timeline['unit_name']}\n")
-                    f.write(f"  Session Type: {unit_timeline['session_type']}\n")
-                    f.write(f"  {'-' * 76}\n\n")
-                    
+                    w(f"  Unit {unit_timeline['unit_index']}: {unit_timeline['unit_name']}\n")
+                    w(f"  Session Type: {unit_timeline['session_type']}\n")
+                    w(f"  {_SUBBAR}\n\n")
+                
+                    # Hottest sites append constants and values separately
+                    # instead of paying f-string formatting per event.
                     for event_idx, event in enumerate(unit_timeline['events'], 1):
-                        f.write(f"    [{event_idx}] {event['type'].upper()}\n")
-                        if 'time_seconds' in event and event['time_seconds'] is not None:
-                            f.write(f"        Time: {event['time_seconds']}s\n")
-                        f.write(f"        {event['description']}\n")
-                        
+                        w("    [")
+                        w(str(event_idx))
+                        w("] ")
+                        w(event.type.upper())
+                        w("\n")
+                        if event.time_seconds is not None:
+                            w("        Time: ")
+                            w(str(event.time_seconds))
+                            w("s\n")
+                        w("        ")
+                        w(event.description)
+                        w("\n")
+                    
                         # Write details
-                        if event['details']:
-                            details = event['details']
-                            
+                        if event.details:
+                            details = event.details
+                        
                             # Display warnings prominently FIRST
                             if 'warnings' in details and details['warnings']:
-                                f.write(f"\n        ⚠️  WARNINGS:\n")
+                                w(f"\n        ⚠️  WARNINGS:\n")
                                 for warning in details['warnings']:
-                                    f.write(f"            {warning}\n")
-                                f.write("\n")
-                            
+                                    w("            ")
+                                    w(warning)
+                                    w("\n")
+                                w("\n")
+                        
                             # Handle question text specially
                             if 'question_text' in details:
-                                f.write(f"        Question: {details['question_text']}\n")
-                            
+                                w(f"        Question: {details['question_text']}\n")
+                        
                             # Handle choices specially for multiple choice
-                            if 'choices' in details:
-                                f.write(f"\n        Choices:\n")
-                                for choice in details['choices']:
-                                    marker = "✓" if choice.get('correct') else " "
-                                    choice_id = choice.get('id', '')
-                                    choice_text = choice.get('text', '')
-                                    f.write(f"          [{marker}] {choice_id}: {choice_text}\n")
+                            if 'choice_ids' in details:
+                                w(f"\n        Choices:\n")
+                                for choice_id, choice_text, correct in zip(
+                                        details['choice_ids'], details['choice_texts'],
+                                        details['choice_correct_flags']):
+                                    w("          [✓] " if correct else "          [ ] ")
+                                    w(choice_id)
+                                    w(": ")
+                                    w(choice_text)
+                                    w("\n")
                             # Adaptive logic diagram lines
                             if 'diagram_lines' in details:
-                                f.write("\n        Adaptive Branching Diagram:\n")
+                                w("\n        Adaptive Branching Diagram:\n")
                                 for line in details['diagram_lines']:
-                                    f.write(f"          {line}\n")
-                            
+                                    w(f"          {line}\n")
+                        
                             # Handle correct answer for text input
                             elif 'correct_answer' in details:
-                                f.write(f"\n        Expected Answer: {details['correct_answer']}\n")
+                                w(f"\n        Expected Answer: {details['correct_answer']}\n")
                                 if 'incorrect_answers' in details:
-                                    f.write(f"        Wrong Answers: {', '.join(details['incorrect_answers'])}\n")
-                            
+                                    w(f"        Wrong Answers: {', '.join(details['incorrect_answers'])}\n")
+                        
                             # Write other details
-                            f.write(f"\n        Details:\n")
+                            w(f"\n        Details:\n")
                             for key, value in details.items():
                                 # Skip items we've already displayed
-                                if key in ['logic_rules', 'choices', 'question_text', 'correct_answer', 'incorrect_answers', 'warnings']:
+                                if key in _SKIP_DETAIL_KEYS:
                                     continue
-                                
-                                if isinstance(value, list) and len(value) > 5:
-                                    f.write(f"          {key}: [{len(value)} items]\n")
+                            
+                                if isinstance(value, list) and (n := len(value)) > 5:
+                                    w(f"          {key}: [{n} items]\n")
                                 elif isinstance(value, str) and len(value) > 100:
-                                    f.write(f"          {key}: {value[:100]}...\n")
+                                    w(f"          {key}: {value[:100]}...\n")
                                 else:
-                                    f.write(f"          {key}: {value}\n")
-                        f.write("\n")
-                    
-                    f.write("\n")
+                                    w(f"          {key}: {value}\n")
+                        w("\n")
+                
+                    w("\n")
+                    emit(''.join(parts).encode('utf-8'))
+                    parts.clear()
+    
+            finally:
+                chunks.put(None)
+                writer.join()
+                if write_error:
+                    raise write_error[0]
         
         print(f"\n✓ Timeline report written to: {output_file}")
 
@@ -1514,28 +2167,25 @@ class PackageValidator:
         """Run all validation checks."""
         print(f"Validating package: {self.zip_path}")
 
-        if not self.validate_zip_exists():
-            return False
-
-        if not self.extract_and_categorize_files():
-            return False
-
-        if not self.validate_package_structure():
-            return False
-
-        if not self.validate_json_structure():
-            return False
-
-        if not self.validate_cross_references():
-            return False
-
-        if not self.validate_media_references():
-            return False
-        
-        if not self.validate_session_consistency():
-            return False
+        checks = [
+            self.validate_zip_exists,
+            self.extract_and_categorize_files,
+            self.validate_package_structure,
+            self.validate_json_structure,
+            self.validate_cross_references,
+            self.validate_media_references,
+            self.validate_session_consistency,
+        ]
+        try:
+            for check in checks:
+                passed = check()
+                self.flush_diagnostics()
+                if not passed:
+                    return False
 
-        return True
+            return True
+        finally:
+            self.close()
 
     def get_summary(self) -> Dict:
         """Get validation summary."""